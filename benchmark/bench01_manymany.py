@@ -0,0 +1,39 @@
+"""
+    time of createModels for a database with a growing number of <> refs
+
+    the column "reparse" is the time of parsing the dbml text of the
+    association tables, the step removed from createModel
+"""
+import sys
+import time
+import types
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createModels
+from synthetic import newBase
+
+
+def source(refs):
+    tables = ["Table left%s {\n    id integer [pk]\n}\n\nTable right%s {\n    id integer [pk]\n}\n" % (i, i) for i in range(refs)]
+    return "\n".join(tables + ["Ref: left%s.id <> right%s.id" % (i, i) for i in range(refs)])
+
+
+def reparse(refs):
+    start = time.perf_counter()
+    for i in range(refs):
+        PyDBML("Table left%s_right%s\n{\nleft%s_id integer\nright%s_id integer\nindexes {\n(left%s_id, right%s_id) [pk]\n}\n}" % (i, i, i, i, i, i))
+    return time.perf_counter() - start
+
+
+def main(sizes):
+    print("%8s %12s %12s %12s" % ("refs", "build (s)", "per ref (ms)", "reparse (s)"))
+    for refs in sizes:
+        parsed = PyDBML(source(refs))
+        start = time.perf_counter()
+        createModels(parsed, newBase(), module=types.ModuleType('bench'))
+        build = time.perf_counter() - start
+        print("%8s %12.4f %12.3f %12.4f" % (refs, build, build * 1000 / refs, reparse(refs)))
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1, 10, 50, 100, 200])
@@ -0,0 +1,45 @@
+"""
+    time of the resolution of the column types
+
+    compare getType/getTypeParams called for each column with createType
+    which parses each type text once, on a schema of varchar(255) and
+    decimal(10,2) columns
+"""
+import sys
+import time
+import types
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createModels
+from dbml_to_sqlalchemy.main import getType, getTypeParams, createType, parseType
+from synthetic import newBase
+
+
+def source(tables, columns):
+    cols = "\n".join(["    col%s %s" % (i, i % 2 and 'decimal(10,2)' or 'varchar(255)') for i in range(columns)])
+    return "\n".join(["Table table%s {\n    id integer [pk]\n%s\n}\n" % (i, cols) for i in range(tables)])
+
+
+def main(tables, columns):
+    parsed = PyDBML(source(tables, columns))
+    cols = [col for table in parsed.tables for col in table.columns]
+    module = types.ModuleType('bench')
+    start = time.perf_counter()
+    for col in cols:
+        getType(col.type)(*getTypeParams(col.type, module)[0], **getTypeParams(col.type, module)[1])
+    before = time.perf_counter() - start
+    parseType.cache_clear()
+    start = time.perf_counter()
+    for col in cols:
+        createType(col.type, module)
+    after = time.perf_counter() - start
+    print("%s columns" % len(cols))
+    print("%-32s %10.4f s" % ("getType + getTypeParams", before))
+    print("%-32s %10.4f s" % ("createType", after))
+    start = time.perf_counter()
+    createModels(parsed, newBase(), module=module)
+    print("%-32s %10.4f s" % ("createModels", time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main(*([int(arg) for arg in sys.argv[1:3]] or [100, 50]))
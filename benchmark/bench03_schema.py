@@ -0,0 +1,89 @@
+"""
+    time and memory of the build of synthetic schemas
+
+    for each size the times of parse, class creation, relationship wiring,
+    mapper configuration and create_all on sqlite in memory are measured,
+    the peak of memory is measured in a second run with tracemalloc, the
+    results are saved in a json file for compare the versions
+
+    PYTHONPATH=. python benchmark/bench03_schema.py -s 10 100 1000 5000 -o bench.json
+"""
+import argparse
+import json
+import platform
+import time
+import tracemalloc
+from types import ModuleType
+
+import sqlalchemy as db
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy.main import createClass, createRelation, __version__
+from synthetic import source, MIX, newBase
+
+
+def build(text):
+    times = {}
+    start = time.perf_counter()
+    parsed = PyDBML(text)
+    times['parse'] = time.perf_counter() - start
+    Base = newBase()
+    module = ModuleType('bench')
+    start = time.perf_counter()
+    classes = {id(table): createClass(table, Base, module=module) for table in parsed.tables}
+    times['classes'] = time.perf_counter() - start
+    start = time.perf_counter()
+    for ref in parsed.refs:
+        createRelation(ref, classes[id(ref.table1)], classes[id(ref.table2)], Base, module=module)
+    times['relationships'] = time.perf_counter() - start
+    start = time.perf_counter()
+    Base.registry.configure()
+    times['configure'] = time.perf_counter() - start
+    start = time.perf_counter()
+    engine = db.create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    times['create_all'] = time.perf_counter() - start
+    engine.dispose()
+    Base.registry.dispose()
+    times['total'] = sum(times.values())
+    return times, len(parsed.tables), len(parsed.refs)
+
+
+def peak(text):
+    tracemalloc.start()
+    build(text)
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='benchmark of the build of synthetic schemas')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=[10, 100, 1000, 5000], help='numbers of tables')
+    parser.add_argument('-m', '--mix', default=','.join('%s:%s' % item for item in MIX.items()), help='weights of the types of ref, default %(default)s')
+    parser.add_argument('-o', '--output', default='bench03_schema.json', help='json file of the results')
+    parser.add_argument('--no-memory', action='store_true', help='do not measure the peak of memory')
+    args = parser.parse_args(argv)
+    mix = {kind: int(weight) for kind, weight in [item.rsplit(':', 1) for item in args.mix.split(',')]}
+    results = []
+    print("%8s %8s %9s %9s %9s %9s %9s %9s %10s" % ('tables', 'refs', 'parse', 'classes', 'rels', 'config', 'create', 'total', 'peak (MB)'))
+    for size in args.sizes:
+        text = source(size, mix=mix)
+        times, tables, refs = build(text)
+        result = {'tables': tables, 'refs': refs, 'times': times}
+        if not args.no_memory:
+            result['peak_memory'] = peak(text)
+        results.append(result)
+        print("%8s %8s %9.3f %9.3f %9.3f %9.3f %9.3f %9.3f %10s" % (tables, refs, times['parse'], times['classes'], times['relationships'], times['configure'], times['create_all'], times['total'], 'peak_memory' in result and '%.1f' % (result['peak_memory'] / 1024 / 1024) or '-'))
+    with open(args.output, 'w') as f:
+        json.dump({
+            'version': __version__,
+            'sqlalchemy': db.__version__,
+            'python': platform.python_version(),
+            'mix': mix,
+            'results': results,
+        }, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
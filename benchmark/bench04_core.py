@@ -0,0 +1,63 @@
+"""
+    time and memory of createTables (Core) compared with createModels (ORM)
+
+    the ORM build includes the mapper configuration done on the first query,
+    the parse of the dbml is done once and is not measured, the peak of
+    memory is measured in a second run with tracemalloc
+
+    PYTHONPATH=. python benchmark/bench04_core.py -s 100 1000
+"""
+import argparse
+import time
+import tracemalloc
+from types import ModuleType
+
+import sqlalchemy as db
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createModels, createTables
+from synthetic import source, newBase
+
+
+def buildOrm(parsed):
+    Base = newBase()
+    createModels(parsed, Base, module=ModuleType('bench'))
+    Base.registry.configure()
+    return Base
+
+
+def buildCore(parsed):
+    metadata = db.MetaData()
+    createTables(parsed, metadata, module=ModuleType('bench'))
+    return metadata
+
+
+def measure(build, parsed):
+    start = time.perf_counter()
+    result = build(parsed)
+    seconds = time.perf_counter() - start
+    if hasattr(result, 'registry'):
+        result.registry.dispose()
+    tracemalloc.start()
+    result = build(parsed)
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    if hasattr(result, 'registry'):
+        result.registry.dispose()
+    return seconds, size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='benchmark of createTables and createModels')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=[100, 1000], help='numbers of tables')
+    args = parser.parse_args(argv)
+    print("%8s %10s %10s %14s %14s" % ('tables', 'orm (s)', 'core (s)', 'orm peak (MB)', 'core peak (MB)'))
+    for size in args.sizes:
+        parsed = PyDBML(source(size))
+        orm = measure(buildOrm, parsed)
+        core = measure(buildCore, parsed)
+        print("%8s %10.3f %10.3f %14.1f %14.1f" % (size, orm[0], core[0], orm[1] / 1024 / 1024, core[1] / 1024 / 1024))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+    time and memory of the docstrings of the classes
+
+    createModels is run with doc=True (built at the creation), doc='lazy'
+    (built from the class on access) and doc=False, the memory kept by the
+    classes after the build is measured with tracemalloc in a second run
+
+    PYTHONPATH=. python benchmark/bench05_doc.py -s 1000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from types import ModuleType
+
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createModels
+from synthetic import source, newBase
+
+
+def build(text, doc, memory=False):
+    parsed = PyDBML(text)
+    Base = newBase()
+    module = ModuleType('bench')
+    gc.collect()
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    createModels(parsed, Base, module=module, doc=doc)
+    seconds = time.perf_counter() - start
+    kept = 0
+    if memory:
+        del parsed
+        gc.collect()
+        kept = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    start = time.perf_counter()
+    size = sum(len(obj.__doc__ or '') for obj in vars(module).values() if hasattr(obj, '__table__'))
+    access = time.perf_counter() - start
+    Base.registry.dispose()
+    return seconds, kept, size, access
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='benchmark of the docstrings of the classes')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=[1000], help='numbers of tables')
+    args = parser.parse_args(argv)
+    print("%8s %8s %10s %10s %12s %12s" % ('tables', 'doc', 'build (s)', 'kept (MB)', 'doc (chars)', 'access (s)'))
+    for size in args.sizes:
+        text = source(size)
+        for doc in (True, 'lazy', False):
+            seconds, _, chars, access = build(text, doc)
+            kept = build(text, doc, memory=True)[1]
+            print("%8s %8s %10.3f %10.1f %12s %12.4f" % (size, doc, seconds, kept / 1024 / 1024, chars, access))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+    time of the parse of a schema split in several files
+
+    the synthetic schema is split in files (tables, enums and refs are
+    spread round robin so most refs are between two files), it is parsed
+    as one text by PyDBML and by loadDbmlFiles with a pool of processes
+
+    PYTHONPATH=. python benchmark/bench06_parse.py -s 2000 -f 8 -p 1 2 4 8
+"""
+import argparse
+import os
+import re
+import shutil
+import tempfile
+import time
+
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy.loader import loadDbmlFiles
+from synthetic import source
+
+
+def split(text, files, directory):
+    blocks = [block for block in re.split(r'(?m)^(?=Table |enum |Ref:)', text) if block.strip()]
+    paths = [os.path.join(directory, 'part%s.dbml' % i) for i in range(files)]
+    for i, path in enumerate(paths):
+        with open(path, 'w') as f:
+            f.write('\n'.join(blocks[i::files]))
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='benchmark of the parse of a schema in several files')
+    parser.add_argument('-s', '--size', type=int, default=2000, help='number of tables')
+    parser.add_argument('-f', '--files', type=int, default=8, help='number of files')
+    parser.add_argument('-p', '--processes', type=int, nargs='+', default=[1, 2, 4, os.cpu_count()], help='numbers of processes')
+    args = parser.parse_args(argv)
+    text = source(args.size)
+    directory = tempfile.mkdtemp()
+    try:
+        paths = split(text, args.files, directory)
+        start = time.perf_counter()
+        PyDBML(text)
+        print("%-24s %10.3f s" % ('PyDBML', time.perf_counter() - start))
+        for processes in args.processes:
+            start = time.perf_counter()
+            loadDbmlFiles(paths, processes=processes)
+            print("%-24s %10.3f s" % ('loadDbmlFiles (%s)' % processes, time.perf_counter() - start))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+    time of the naming of the classes, tables and columns in createModel
+
+    the classes of a synthetic schema are built table by table by createModel
+    with the cached Naming and with a naming which calls re.sub for each name
+    (as before the Naming), the calls of the naming are replayed alone
+
+    PYTHONPATH=. python benchmark/bench07_naming.py -s 500
+"""
+import argparse
+import time
+from re import sub
+from types import ModuleType
+
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createModel, Naming
+from synthetic import source, newBase
+
+
+class UncachedNaming(Naming):
+    # each name is computed on each call by re.sub with a pattern not compiled
+
+    def __init__(self):
+        Naming.__init__(self)
+        self.calls = []
+
+    def className(self, name):
+        self.calls.append(('className', name))
+        st = sub('[^a-zA-Z0-9 \n]', '', name.replace('.', ' '))
+        return sub(r"(_|-)", " ", st).title().replace(" ", "")
+
+    def tableName(self, name):
+        self.calls.append(('tableName', name))
+        return name.lower().replace(" ", "_")
+
+    def columnName(self, name):
+        self.calls.append(('columnName', name))
+        st = sub('[^a-zA-Z0-9 _\n]', '', name.replace('.', ' '))
+        return st.lower().replace(" ", "_")
+
+
+def build(text, naming):
+    parsed = PyDBML(text)
+    Base = newBase()
+    module = ModuleType('bench')
+    start = time.perf_counter()
+    for table in parsed.tables:
+        createModel(table, Base, module=module, naming=naming)
+    seconds = time.perf_counter() - start
+    Base.registry.dispose()
+    return seconds
+
+
+def replay(naming, calls):
+    start = time.perf_counter()
+    for method, name in calls:
+        getattr(naming, method)(name)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='benchmark of the naming in createModel')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=[500], help='numbers of tables')
+    args = parser.parse_args(argv)
+    print("%8s %12s %12s %12s %12s %14s %14s" % ('tables', 're.sub (s)', 'cached (s)', 'calls', 'names', 'calls re.sub', 'calls cached'))
+    for size in args.sizes:
+        text = source(size)
+        uncached = UncachedNaming()
+        before = build(text, uncached)
+        cached = Naming()
+        after = build(text, cached)
+        names = sum(len(names) for names in cached.mapping().values())
+        # only the time of the names, for the calls of createModel
+        calls = uncached.calls
+        uncached.calls = []
+        print("%8s %12.3f %12.3f %12s %12s %14.4f %14.4f" % (size, before, after, len(calls), names, replay(uncached, calls), replay(cached, calls)))
+
+
+if __name__ == "__main__":
+    main()
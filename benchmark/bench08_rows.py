@@ -0,0 +1,94 @@
+"""
+    memory by row and rows by second of the Row Class compared with the Model Class
+
+    a table of sqlite (file in a temporary directory) is loaded with n rows,
+    all the rows are read by session.scalars(select(Model)).all() and by
+    fetchRows in the named tuples of createRow, the time is measured without
+    tracemalloc and the memory kept by the rows in a second run with it
+
+    PYTHONPATH=. python benchmark/bench08_rows.py -n 1000000
+"""
+import argparse
+import datetime
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+from types import ModuleType
+
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createModel
+from dbml_to_sqlalchemy.bulk import bulkInsert
+from dbml_to_sqlalchemy.rows import createRow, fetchRows
+from synthetic import newBase
+
+
+SOURCE = """
+Table events {
+    id integer [pk]
+    user_id integer
+    name varchar
+    amount float
+    created timestamp
+}
+"""
+
+
+def generate(size):
+    start = datetime.datetime(2024, 1, 1)
+    for i in range(size):
+        yield (i + 1, i % 1000, 'event %s' % (i % 100), i * 0.5, start + datetime.timedelta(seconds=i))
+
+
+def readOrm(engine, Model):
+    with Session(engine) as session:
+        rows = session.scalars(db.select(Model)).all()
+        # the objects are kept out of the session, as the tuples
+        session.expunge_all()
+    return rows
+
+
+def readRows(engine, RowClass, Model):
+    return fetchRows(engine, RowClass, Model)
+
+
+def measure(fn, *args):
+    gc.collect()
+    start = time.perf_counter()
+    rows = fn(*args)
+    seconds = time.perf_counter() - start
+    count = len(rows)
+    del rows
+    gc.collect()
+    tracemalloc.start()
+    rows = fn(*args)
+    kept = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del rows
+    return count, seconds, kept
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='benchmark of the Row Class and the Model Class')
+    parser.add_argument('-n', '--rows', type=int, default=1000000, help='number of rows')
+    args = parser.parse_args(argv)
+    table = PyDBML(SOURCE).tables[0]
+    Model = createModel(table, newBase(), module=ModuleType('models'))
+    RowClass = createRow(table, module=ModuleType('rows'))
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = db.create_engine("sqlite:///%s" % os.path.join(tmp, 'bench.db'))
+        Model.metadata.create_all(engine)
+        bulkInsert(engine, Model, generate(args.rows), batch=50000)
+        print("%10s %10s %12s %14s %12s" % ('class', 'rows', 'seconds', 'rows/s', 'bytes/row'))
+        for name, fn, fnargs in (('orm', readOrm, (engine, Model)), ('row', readRows, (engine, RowClass, Model))):
+            count, seconds, kept = measure(fn, *fnargs)
+            print("%10s %10s %12.3f %14.0f %12.0f" % (name, count, seconds, count / seconds, kept / count))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
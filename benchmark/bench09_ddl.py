@@ -0,0 +1,57 @@
+"""
+    time and calls to the database of create_all compared with applyScript
+
+    the tables of a synthetic schema are created in a sqlite file by
+    metadata.create_all (a checkfirst query by table and a statement by
+    DDL) and by applyScript (one executescript), the calls are counted by the
+    event before_cursor_execute (the executescript of sqlite3 is one call of
+    the driver not seen by this event)
+
+    PYTHONPATH=. python benchmark/bench09_ddl.py -s 100 600
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import sqlalchemy as db
+from sqlalchemy import event
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createTables
+from dbml_to_sqlalchemy.ddl import applyScript
+from synthetic import source
+
+
+def run(parsed, path, fn):
+    metadata = db.MetaData()
+    createTables(parsed, metadata)
+    engine = db.create_engine("sqlite:///%s" % path)
+    calls = []
+    event.listen(engine, 'before_cursor_execute', lambda *args: calls.append(1))
+    start = time.perf_counter()
+    fn(engine, metadata)
+    seconds = time.perf_counter() - start
+    count = len(calls)
+    tables = len(db.inspect(engine).get_table_names())
+    engine.dispose()
+    os.remove(path)
+    return seconds, count, tables
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='benchmark of create_all and applyScript')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=[100, 600], help='numbers of tables')
+    args = parser.parse_args(argv)
+    print("%8s %14s %14s %14s %14s %10s" % ('tables', 'create_all (s)', 'calls', 'script (s)', 'calls', 'created'))
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            parsed = PyDBML(source(size))
+            path = os.path.join(tmp, 'bench.db')
+            before, beforeCalls, beforeTables = run(parsed, path, lambda engine, metadata: metadata.create_all(engine))
+            after, afterCalls, afterTables = run(parsed, path, applyScript)
+            print("%8s %14.3f %14s %14.3f %14s %10s" % (size, before, beforeCalls, after, afterCalls, '%s/%s' % (beforeTables, afterTables)))
+
+
+if __name__ == "__main__":
+    main()
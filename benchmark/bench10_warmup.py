@@ -0,0 +1,82 @@
+"""
+    time of the first request of a forked worker with and without warmup
+
+    the classes of a synthetic schema are built in the master, the tables are
+    created in a sqlite file and the master forks a worker (as gunicorn
+    --preload), the worker measures its first query get by primary key (with
+    the configuration of the mappers if they are not configured) and the
+    second one, the warmup of the master is measured too
+
+    PYTHONPATH=. python benchmark/bench10_warmup.py -s 100 500
+"""
+import argparse
+import os
+import tempfile
+import time
+from types import ModuleType
+
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createModels
+from dbml_to_sqlalchemy.warmup import warmup
+from synthetic import source, newBase
+
+
+def request(engine, Model):
+    start = time.perf_counter()
+    with Session(engine) as session:
+        session.execute(db.select(Model).where(Model.__table__.c.id == db.bindparam('id')), {'id': 1}).all()
+    return time.perf_counter() - start
+
+
+def worker(engine, Model):
+    # the times of the worker are sent to the master by a pipe
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read)
+        first = request(engine, Model)
+        os.write(write, ("%r %r" % (first, request(engine, Model))).encode('ascii'))
+        os._exit(0)
+    os.close(write)
+    data = os.read(read, 1024).decode('ascii')
+    os.close(read)
+    os.waitpid(pid, 0)
+    return [float(val) for val in data.split()]
+
+
+def run(parsed, path, warm):
+    Base = newBase()
+    module = ModuleType('bench')
+    createModels(parsed, Base, module=module)
+    engine = db.create_engine("sqlite:///%s" % path)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+    start = time.perf_counter()
+    if warm:
+        warmup(Base, module=module, bind=engine)
+    seconds = time.perf_counter() - start
+    first, second = worker(engine, module.Table0)
+    engine.dispose()
+    Base.registry.dispose()
+    os.remove(path)
+    return seconds, first, second
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='benchmark of the first request of a forked worker')
+    parser.add_argument('-s', '--sizes', type=int, nargs='+', default=[100, 500], help='numbers of tables')
+    args = parser.parse_args(argv)
+    print("%8s %8s %12s %14s %14s" % ('tables', 'warmup', 'master (s)', 'first (ms)', 'second (ms)'))
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            parsed = PyDBML(source(size))
+            for warm in (False, True):
+                seconds, first, second = run(parsed, os.path.join(tmp, 'bench.db'), warm)
+                print("%8s %8s %12.3f %14.2f %14.2f" % (size, warm, seconds, first * 1000, second * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+    synthetic dbml schema for the benchmarks
+
+    each table has a primary key, a varchar, a decimal, a composite index and
+    for some tables an enum column, each table after the first one has a ref
+    to a previous table, the type of the ref is chosen with the weights of mix
+"""
+import random
+
+from sqlalchemy.orm import DeclarativeBase
+
+MIX = {'<': 1, '>': 4, '-': 1, '<>': 1}
+
+
+def newBase():
+    # a new declarative base for each build
+    class Base(DeclarativeBase):
+        pass
+    return Base
+
+
+def source(tables, mix=MIX, seed=0, enums=5):
+    rand = random.Random(seed)
+    kinds = [kind for kind in mix for i in range(mix[kind])]
+    lines = ["enum status%s {\n    created\n    running\n    done\n}\n" % i for i in range(enums)]
+    refs = []
+    for i in range(tables):
+        cols = ["    id integer [pk, increment]", "    name varchar(255) [not null]", "    code varchar(20)", "    amount decimal(10,2) [default: 0]"]
+        if enums and i % 5 == 0:
+            cols.append("    status status%s" % (i % enums))
+        if i > 0:
+            j = rand.randrange(i)
+            kind = rand.choice(kinds)
+            if kind == '<>':
+                refs.append("Ref: table%s.id <> table%s.id" % (i, j))
+            else:
+                cols.append("    ref_id integer")
+                if kind == '<':
+                    refs.append("Ref: table%s.id < table%s.ref_id" % (j, i))
+                else:
+                    refs.append("Ref: table%s.ref_id %s table%s.id" % (i, kind, j))
+        index = i % 3 == 0 and "(code, name) [unique]" or "(code, name)"
+        lines.append("Table table%s {\n%s\n\n    indexes {\n        %s\n    }\n}\n" % (i, "\n".join(cols), index))
+    return "\n".join(lines + refs)
@@ -1 +1,2 @@
-from .main import createModel
+from .main import createModel, createModels, createLazyModels, createTable, createTables, Naming, SnakeNaming
+from .registry import Registry
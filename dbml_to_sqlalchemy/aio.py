@@ -0,0 +1,92 @@
+"""
+    Model Class for AsyncSession and create_async_engine
+
+    the lazy loading of a relationship needs io when the attribute is read,
+    under asyncio the relationships raise on sql by default and they are
+    loaded by selectin (or joined, ...) when it is chosen, the base has the
+    mixin AsyncAttrs for await the others
+"""
+from sqlalchemy.ext.asyncio import AsyncAttrs
+
+from dbml_to_sqlalchemy import mymodel
+from dbml_to_sqlalchemy.main import createModel, createModels, createLazyModels
+from dbml_to_sqlalchemy.registry import createBase, Registry
+from dbml_to_sqlalchemy.warmup import asyncWarmup
+
+ASYNC_LAZY = ('selectin', 'joined', 'subquery', 'immediate', 'raise', 'raise_on_sql', 'noload', 'write_only')
+
+
+class AsyncLazy(dict):
+    # strategies by "Class.relationship" and "*", the strategy chosen for a
+    # relationship (by this dict or by the comment of the ref) is checked
+
+    default = 'raise_on_sql'
+
+    def check(self, strategy, name):
+        if strategy not in ASYNC_LAZY:
+            raise ValueError("lazy %r of %s is not usable with asyncio, use one of %s" % (strategy, name, ', '.join(ASYNC_LAZY)))
+        return strategy
+
+
+def getAsyncLazy(lazy):
+    # by default a relationship raises when it needs a query, selectin (or
+    # joined, ...) is chosen by relationship: a load does not load the graph
+    if lazy is None:
+        lazy = {}
+    if not isinstance(lazy, dict):
+        lazy = {'*': lazy}
+    lazy = AsyncLazy(lazy)
+    for name, strategy in lazy.items():
+        lazy.check(strategy, name)
+    lazy.setdefault('*', AsyncLazy.default)
+    return lazy
+
+
+def createAsyncBase(*mixins, metadata=None):
+    return createBase(AsyncAttrs, *mixins, metadata=metadata)
+
+
+def createAsyncModel(table, *cls, module=mymodel, lazy=None, **options):
+    return createModel(table, *cls, module=module, lazy=getAsyncLazy(lazy), **options)
+
+
+def createAsyncModels(database, *cls, module=mymodel, lazy=None, **options):
+    return createModels(database, *cls, module=module, lazy=getAsyncLazy(lazy), **options)
+
+
+def createAsyncLazyModels(database, *cls, module=mymodel, lazy=None, **options):
+    return createLazyModels(database, *cls, module=module, lazy=getAsyncLazy(lazy), **options)
+
+
+async def createAll(engine, metadata):
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+
+
+async def dropAll(engine, metadata):
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.drop_all)
+
+
+class AsyncRegistry(Registry):
+
+    def __init__(self, *mixins, name='models', metadata=None, naming=None):
+        Registry.__init__(self, AsyncAttrs, *mixins, name=name, metadata=metadata, naming=naming)
+
+    def createModel(self, table, lazy=None, **options):
+        return Registry.createModel(self, table, lazy=getAsyncLazy(lazy), **options)
+
+    def createModels(self, database, lazy=None, **options):
+        return Registry.createModels(self, database, lazy=getAsyncLazy(lazy), **options)
+
+    def createLazyModels(self, database, lazy=None, **options):
+        return Registry.createLazyModels(self, database, lazy=getAsyncLazy(lazy), **options)
+
+    async def createAll(self, engine):
+        await createAll(engine, self.metadata)
+
+    async def dropAll(self, engine):
+        await dropAll(engine, self.metadata)
+
+    async def warmup(self, bind=None, freeze=False):
+        return await asyncWarmup(self.Base, module=self.models, bind=bind, freeze=freeze)
@@ -0,0 +1,70 @@
+"""
+    Load rows in the tables of the Model Class by insert executemany
+
+    rows are read by batch from any iterable of dict, tuple or list
+    (csv.reader, csv.DictReader, cursor, generator, ...)
+"""
+import logging
+import time
+from itertools import islice
+
+from sqlalchemy import insert, inspect
+from sqlalchemy.engine import Engine
+from sqlalchemy.schema import sort_tables
+
+logger = logging.getLogger(__name__)
+
+
+def getTable(model):
+    return getattr(model, '__table__', model)
+
+
+def getKeys(model, columns):
+    # keys of the dict are the attributes of the class, insert needs the keys of the columns
+    table = getTable(model)
+    keys = {}
+    if table is not model:
+        keys = {prop.key: prop.columns[0].key for prop in inspect(model).column_attrs if prop.key != prop.columns[0].key}
+    if columns is None:
+        columns = [col.key for col in table.columns]
+    return keys, [keys.get(col, col) for col in columns]
+
+
+def batches(rows, keys, columns, size):
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if len(batch) == 0:
+            return
+        if isinstance(batch[0], dict):
+            if len(keys) > 0:
+                batch = [{keys.get(key, key): val for key, val in row.items()} for row in batch]
+        else:
+            batch = [dict(zip(columns, row)) for row in batch]
+        yield batch
+
+
+def bulkInsert(bind, model, rows, columns=None, batch=10000):
+    if isinstance(bind, Engine):
+        with bind.begin() as connection:
+            return bulkInsert(connection, model, rows, columns=columns, batch=batch)
+    table = getTable(model)
+    keys, columns = getKeys(model, columns)
+    stmt = insert(table).execution_options(insertmanyvalues_page_size=batch)
+    count = 0
+    start = time.perf_counter()
+    for values in batches(rows, keys, columns, batch):
+        bind.execute(stmt, values)
+        count = count + len(values)
+    seconds = time.perf_counter() - start
+    stats = {'table': table.name, 'rows': count, 'seconds': seconds, 'rows_per_second': seconds and count / seconds or 0.0}
+    logger.info("%s: %s rows in %.3fs (%.0f rows/s)", stats['table'], stats['rows'], stats['seconds'], stats['rows_per_second'])
+    return stats
+
+
+def bulkLoad(bind, data, batch=10000):
+    if isinstance(bind, Engine):
+        with bind.begin() as connection:
+            return bulkLoad(connection, data, batch=batch)
+    models = {getTable(model): model for model in data}
+    return [bulkInsert(bind, models[table], data[models[table]], batch=batch) for table in sort_tables(models.keys())]
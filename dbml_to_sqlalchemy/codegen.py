@@ -0,0 +1,213 @@
+"""
+    Generate a static python module of SqlAlchemy Model Class from a dbml file
+
+    the module is rendered from the classes built by createModels, so the
+    generated code only needs sqlalchemy at runtime
+"""
+import argparse
+import enum
+import inspect
+import keyword
+import sys
+import types
+
+from pydbml import PyDBML
+import sqlalchemy as db
+from sqlalchemy.orm import ONETOMANY, MANYTOONE
+from sqlalchemy.sql import elements
+
+from dbml_to_sqlalchemy.main import createModels, __version__
+from dbml_to_sqlalchemy.registry import createBase
+from dbml_to_sqlalchemy import serializer
+
+HEADER = '''# generated by dbml-to-sqlalchemy %s, do not edit
+import enum
+from operator import attrgetter, itemgetter
+import sqlalchemy
+import sqlalchemy.types
+from sqlalchemy import Column, Enum, PrimaryKeyConstraint, UniqueConstraint, ForeignKeyConstraint, Index
+from sqlalchemy.sql import expression
+from sqlalchemy.orm import relationship
+'''
+
+BASE = '''from sqlalchemy.orm import DeclarativeBase
+
+
+class Base(DeclarativeBase):
+    pass'''
+
+# the serializers of the classes are copied in the module, it only needs sqlalchemy
+SERIALIZERS = (serializer.createGetter, serializer.toDict, serializer.fromDict, serializer.toDicts, serializer.createSerializers)
+
+
+def renderValue(val):
+    if isinstance(val, elements.True_):
+        return 'expression.true()'
+    if isinstance(val, elements.False_):
+        return 'expression.false()'
+    if isinstance(val, elements.TextClause):
+        return 'sqlalchemy.text(%r)' % val.text
+    if val is None or isinstance(val, (str, int, float, bool)):
+        return repr(val)
+    return repr(str(val))
+
+
+def renderType(typ):
+    if isinstance(typ, db.Enum) and typ.enum_class is not None:
+        return 'Enum(%s, create_constraint=%r)' % (typ.enum_class.__name__, typ.create_constraint)
+    return 'sqlalchemy.types.%r' % typ
+
+
+def renderKey(key, column):
+    # the attribute of a dbml name which is not an identifier ("Full Name",
+    # class, ...) is the name of the column, the name in the database is the same
+    if key.isidentifier() and not keyword.iskeyword(key):
+        return key
+    key = column.name if column.name.isidentifier() else '_'.join(''.join(char if char.isalnum() else ' ' for char in column.name).split())
+    if not key.isidentifier():
+        key = '_%s' % key
+    if keyword.iskeyword(key):
+        key = '%s_' % key
+    return key
+
+
+def renderColumn(key, column):
+    args = [repr(column.name), renderType(column.type)]
+    args.append('primary_key=%r' % column.primary_key)
+    args.append('autoincrement=%r' % column.autoincrement)
+    args.append('nullable=%r' % column.nullable)
+    args.append('default=%s' % renderValue(column.default.arg if column.default is not None else None))
+    args.append('server_default=%s' % renderValue(column.server_default.arg if column.server_default is not None else None))
+    args.append('unique=%r' % bool(column.unique))
+    args.append('comment=%s' % renderValue(str(column.comment) if column.comment else None))
+    return '    %s = Column(%s)' % (renderKey(key, column), ', '.join(args))
+
+
+def renderConstraint(constraint):
+    if isinstance(constraint, db.PrimaryKeyConstraint):
+        if constraint.name is None:
+            return None
+        return 'PrimaryKeyConstraint(%s, name=%r)' % (', '.join(repr(col.name) for col in constraint.columns), constraint.name)
+    if isinstance(constraint, db.UniqueConstraint):
+        if getattr(constraint, '_column_flag', False):
+            return None
+        return 'UniqueConstraint(%s, name=%s)' % (', '.join(repr(col.name) for col in constraint.columns), renderValue(constraint.name))
+    if isinstance(constraint, db.ForeignKeyConstraint):
+        return 'ForeignKeyConstraint([%s], [%s], name=%s)' % (', '.join(repr(fk.parent.name) for fk in constraint.elements), ', '.join(repr('%s.%s' % (fk.column.table.name, fk.column.name)) for fk in constraint.elements), renderValue(constraint.name))
+    return None
+
+
+def renderIndex(index):
+    args = [repr(index.name)] + [isinstance(col, elements.TextClause) and renderValue(col) or repr(col.name) for col in index.expressions]
+    if index.unique:
+        args.append('unique=True')
+    args.extend('%s=%r' % item for item in sorted(index.dialect_kwargs.items()))
+    return 'Index(%s)' % ', '.join(args)
+
+
+def renderRelationship(rel):
+    args = [repr(rel.mapper.class_.__name__)]
+    if rel.secondary is not None:
+        args.append('secondary=%r' % rel.secondary.name)
+    if rel.back_populates:
+        args.append('back_populates=%r' % rel.back_populates)
+    if rel.direction is ONETOMANY and not rel.uselist:
+        args.append('uselist=False')
+    if rel.direction is MANYTOONE and rel.uselist:
+        args.append('uselist=True')
+    if rel.lazy != 'select':
+        args.append('lazy=%r' % rel.lazy)
+    if rel.viewonly:
+        args.append('viewonly=True')
+    return '    %s = relationship(%s)' % (rel.key, ', '.join(args))
+
+
+def renderDoc(doc):
+    return '    """%s"""' % (doc or '').replace('\\', '\\\\').replace('"""', '\\"\\"\\"')
+
+
+def renderSerializers(cls):
+    props = {prop.columns[0].name: prop.key for prop in db.inspect(cls).column_attrs}
+    keys = [renderKey(props[col.name], col) for col in cls.__table__.columns]
+    return ['', '', 'for name, value in createSerializers(%r, %r).items():' % (keys, [col.key for col in cls.__table__.columns]),
+            '    setattr(%s, name, value)' % cls.__name__]
+
+
+def renderClass(cls):
+    mapper = db.inspect(cls)
+    table = cls.__table__
+    keys = {prop.columns[0].name: prop.key for prop in mapper.column_attrs}
+    lines = ['', '', 'class %s(Base):' % cls.__name__, renderDoc(cls.__doc__)]
+    lines.append('    __tablename__ = %r' % table.name)
+    tableArgs = [arg for arg in [renderConstraint(constraint) for constraint in table.constraints] if arg is not None]
+    tableArgs.extend(renderIndex(index) for index in sorted(table.indexes, key=lambda index: index.name) if not getattr(index, '_column_flag', False))
+    kwargs = dict(sorted(table.dialect_kwargs.items()))
+    if len(table.info) > 0:
+        kwargs['info'] = table.info
+    if len(kwargs) > 0:
+        tableArgs.append(repr(kwargs))
+    if len(tableArgs) > 0:
+        lines.append('    __table_args__ = (%s, )' % ', '.join(tableArgs))
+    if '__bind_key__' in vars(cls):
+        lines.append('    __bind_key__ = %r' % cls.__bind_key__)
+    lines.append('')
+    for column in table.columns:
+        lines.append(renderColumn(keys[column.name], column))
+    for rel in mapper.relationships:
+        lines.append(renderRelationship(rel))
+    for name, attr in vars(cls).items():
+        if isinstance(attr, property) and hasattr(attr.fget, '__dbml_many__'):
+            lines.append('')
+            lines.append('    @property')
+            lines.append('    def %s(self):' % name)
+            lines.append('        return [elt.%s for elt in self.%s]' % (attr.fget.__dbml_many__[1], attr.fget.__dbml_many__[0]))
+    lines.extend(renderSerializers(cls))
+    return lines
+
+
+def generateModule(database, base=None):
+    scratch = types.ModuleType('scratch')
+    Base = createBase()
+    createModels(database, Base, module=scratch)
+    Base.registry.configure()
+    lines = [HEADER % __version__]
+    if base is None:
+        lines.append(BASE)
+    else:
+        modname, _, name = base.partition(':')
+        if name in ('', 'Base'):
+            lines.append('from %s import Base' % modname)
+        else:
+            lines.append('from %s import %s as Base' % (modname, name))
+    for fn in SERIALIZERS:
+        lines.append('')
+        lines.append('')
+        lines.append(inspect.getsource(fn).rstrip())
+    enums = ['%s = enum.Enum(%r, %r)' % (name, obj.__name__, [item.name for item in obj]) for name, obj in vars(scratch).items() if isinstance(obj, type) and issubclass(obj, enum.Enum)]
+    if len(enums) > 0:
+        lines.append('')
+        lines.extend(enums)
+    for name, obj in vars(scratch).items():
+        if isinstance(obj, type) and hasattr(obj, '__table__'):
+            lines.extend(renderClass(obj))
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='dbml-to-sqlalchemy', description='generate a python module of SqlAlchemy Model Class from a dbml file')
+    parser.add_argument('source', help='dbml file')
+    parser.add_argument('-o', '--output', help='python file generated, default stdout')
+    parser.add_argument('-b', '--base', help='declarative base used by the classes as module:name, default a new Base')
+    args = parser.parse_args(argv)
+    with open(args.source) as f:
+        code = generateModule(PyDBML(f.read()), base=args.base)
+    if args.output is None:
+        sys.stdout.write(code)
+    else:
+        with open(args.output, 'w') as f:
+            f.write(code)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+    Script of the DDL of a MetaData
+
+    the statements of create_all (enums, tables sorted by the foreign keys,
+    comments, indexes, partitions, ...) are rendered for a dialect without
+    the checkfirst queries, the foreign keys of a cycle are created by ALTER
+    (use_alter), the script is applied in one transaction
+"""
+from sqlalchemy import create_mock_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.engine.interfaces import Dialect
+from sqlalchemy.schema import sort_tables_and_constraints
+
+
+def getDialect(dialect):
+    # name of a dialect, Dialect, Engine or Connection
+    if isinstance(dialect, str):
+        # named paramstyle, % of the values is not escaped in the script
+        return make_url('%s://' % dialect).get_dialect()(paramstyle='named')
+    if isinstance(dialect, Dialect):
+        return dialect
+    return dialect.dialect
+
+
+def getCycles(metadata, tables=None):
+    # the foreign keys of the cycles can not be sorted, they are created after the tables
+    tables = tables if tables is not None else metadata.tables.values()
+    return sort_tables_and_constraints(tables)[-1][1]
+
+
+def collectDdl(metadata, dialect, tables=None):
+    # the DDL elements executed by create_all, in its order, use_alter is
+    # set on the foreign keys of the cycles only while the DDL is collected
+    cycles = [constraint for constraint in getCycles(metadata, tables) if not constraint.use_alter]
+    ddls = []
+    mock = create_mock_engine(make_url('%s+%s://' % (dialect.name, dialect.driver)), lambda ddl, *args, **kw: ddls.append(ddl))
+    try:
+        for constraint in cycles:
+            constraint.use_alter = True
+        metadata.create_all(mock, tables=tables, checkfirst=False)
+    finally:
+        for constraint in cycles:
+            constraint.use_alter = False
+    return ddls
+
+
+def createScript(metadata, dialect='sqlite', tables=None):
+    dialect = getDialect(dialect)
+    return [str(ddl.compile(dialect=dialect)).strip() for ddl in collectDdl(metadata, dialect, tables)]
+
+
+def renderScript(metadata, dialect='sqlite', tables=None):
+    return ''.join('%s;\n\n' % stmt for stmt in createScript(metadata, dialect, tables))
+
+
+def applyScript(bind, metadata, tables=None):
+    # Engine: one transaction, by executescript for sqlite3 (one call)
+    # Connection: the statements are executed in the transaction of the connection
+    ddls = collectDdl(metadata, bind.dialect, tables)
+    if not isinstance(bind, Engine):
+        for ddl in ddls:
+            bind.execute(ddl)
+        return len(ddls)
+    with bind.connect() as connection:
+        dbapi = connection.connection.dbapi_connection
+        if hasattr(dbapi, 'executescript'):
+            script = ''.join('%s;\n' % str(ddl.compile(dialect=bind.dialect)).strip() for ddl in ddls)
+            try:
+                dbapi.executescript('BEGIN;\n%sCOMMIT;\n' % script)
+            except Exception:
+                dbapi.rollback()
+                raise
+        else:
+            with connection.begin():
+                for ddl in ddls:
+                    connection.execute(ddl)
+    return len(ddls)
@@ -0,0 +1,156 @@
+"""
+    Update the Model Class of a module from a new version of the dbml
+
+    each table has a fingerprint of its columns, indexes, refs and enums,
+    only the tables which are changed and their direct neighbours by refs
+    are rebuilt, the classes linked to a rebuilt class are kept with new
+    relationships, the report of the changes can be used for a migration
+"""
+import hashlib
+import json
+
+import sqlalchemy
+from sqlalchemy.orm import instrumentation, RelationshipProperty
+from sqlalchemy.orm import relationships
+
+from dbml_to_sqlalchemy import mymodel
+from dbml_to_sqlalchemy.main import createClass, createRelation, getLock, publishLock, getTableOptions, getNaming
+from dbml_to_sqlalchemy.loader import dumpValue
+
+
+def columnSpec(col):
+    if col.type.__class__.__name__ == 'Enum':
+        typ = {'enum': col.type.name, 'items': [item.name for item in col.type.items]}
+    else:
+        typ = col.type
+    return [col.name, typ, col.unique, col.not_null, col.pk, col.autoinc, dumpValue(col.default), col.note.text]
+
+
+def tableSpec(table, refs):
+    return {
+        'note': table.note.text,
+        'options': getTableOptions(table),
+        'columns': [columnSpec(col) for col in table.columns],
+        'indexes': [[[getattr(col, 'name', None) or dumpValue(col) for col in index.subjects], index.name, index.unique, index.type, index.pk] for index in table.indexes],
+        'refs': sorted([[ref.type, ref.table1.name, [col.name for col in ref.col1], ref.table2.name, [col.name for col in ref.col2], ref.name, ref.on_update, ref.on_delete, ref.comment] for ref in refs], key=json.dumps),
+    }
+
+
+def fingerprint(spec):
+    return hashlib.sha1(json.dumps(spec, sort_keys=True).encode('utf8')).hexdigest()
+
+
+def disposeManager(manager):
+    # private api of sqlalchemy (registry._managers and
+    # registry._dispose_manager_and_mapper): a registry can only dispose all
+    # its classes, one class is removed as registry.dispose() does it for each
+    # of its classes
+    registry = manager.registry
+    if not hasattr(registry, '_dispose_manager_and_mapper') or not hasattr(registry, '_managers'):
+        raise RuntimeError("the dispose of a class needs the private api of the registry of sqlalchemy, not found in %s" % sqlalchemy.__version__)
+    registry._managers.pop(manager, None)
+    registry._dispose_manager_and_mapper(manager)
+
+
+def forgetSyncTargets(props):
+    # private api of sqlalchemy (_JoinCondition._track_overlapping_sync_targets):
+    # the relationships of a disposed class to a kept class are not seen as
+    # conflicts of the new relationships of the kept class
+    for targets in getattr(getattr(relationships, '_JoinCondition', None), '_track_overlapping_sync_targets', {}).values():
+        for prop in props:
+            targets.pop(prop, None)
+
+
+def disposeClass(SomeClass):
+    table = SomeClass.__table__
+    manager = instrumentation.manager_of_class(SomeClass)
+    if manager is not None and manager.registry is not None:
+        props = [prop for prop in manager.mapper._props.values() if isinstance(prop, RelationshipProperty)]
+        disposeManager(manager)
+        forgetSyncTargets(props)
+    if table.metadata.tables.get(table.key) is table:
+        table.metadata.remove(table)
+
+
+def removeRelationships(SomeClass, names):
+    # private api of sqlalchemy (Mapper._props and ClassManager): declarative
+    # can not unmap an attribute, the relationships of a kept class to the
+    # disposed classes are removed before createRelation sets them again, the
+    # mapper is configured again with the new classes (only its new properties
+    # are initialized)
+    mapper = SomeClass.__mapper__
+    manager = instrumentation.manager_of_class(SomeClass)
+    if not hasattr(mapper, '_props') or not hasattr(manager, 'local_attrs'):
+        raise RuntimeError("the update of a relationship needs the private api of the mapper of sqlalchemy, not found in %s" % sqlalchemy.__version__)
+    for key, prop in list(mapper._props.items()):
+        if isinstance(prop, RelationshipProperty) and prop.argument in names:
+            del mapper._props[key]
+            mapper._init_properties.pop(key, None)
+            manager.local_attrs.pop(key, None)
+            manager.pop(key, None)
+            type.__delattr__(SomeClass, key)
+    manager._reset_memoizations()
+    mapper._expire_memoizations()
+    mapper.configured = False
+
+
+def diffColumns(old, new):
+    old = {col[0]: col for col in old['columns']}
+    new = {col[0]: col for col in new['columns']}
+    return {
+        'added': [name for name in new if name not in old],
+        'removed': [name for name in old if name not in new],
+        'changed': [name for name in new if name in old and new[name] != old[name]],
+    }
+
+
+def updateModels(database, *cls, module=mymodel, **options):
+    previous = vars(module).get('__dbml__', {})
+    naming = options['naming'] = getNaming(options.get('naming'))
+    tables = {table.name: table for table in database.tables}
+    refs = {name: [] for name in tables}
+    for ref in database.refs:
+        refs[ref.table1.name].append(ref)
+        if ref.table2 is not ref.table1:
+            refs[ref.table2.name].append(ref)
+    current = {}
+    for name, table in tables.items():
+        spec = tableSpec(table, refs[name])
+        current[name] = {
+            'class': naming.className(name),
+            'fingerprint': fingerprint(spec),
+            'spec': spec,
+            'neighbours': sorted(set(other.name for ref in refs[name] for other in (ref.table1, ref.table2) if other.name != name)),
+            'associations': [[naming.className("%s_%s" % (ref.table1.name, ref.table2.name)), ref.table2.name] for ref in refs[name] if ref.type == '<>' and ref.table1 is table],
+        }
+    report = {
+        'added': [name for name in current if name not in previous],
+        'removed': [name for name in previous if name not in current],
+        'changed': [name for name in current if name in previous and previous[name]['fingerprint'] != current[name]['fingerprint']],
+    }
+    report['columns'] = {name: diffColumns(previous[name]['spec'], current[name]['spec']) for name in report['changed']}
+    # the tables linked by a ref to a changed table are rebuilt, the other
+    # classes linked to a rebuilt class are kept and only get new relationships
+    rebuilt = set(report['added'] + report['removed'] + report['changed'])
+    for name in list(rebuilt):
+        for state in (previous, current):
+            rebuilt.update(state.get(name, {}).get('neighbours', []))
+    disposed = [previous.get(name, current.get(name))['class'] for name in rebuilt]
+    disposed += [clsname for name, state in previous.items() for clsname, other in state['associations'] if name in rebuilt or other in rebuilt]
+    with getLock(cls), publishLock:
+        for clsname in disposed:
+            SomeClass = vars(module).get(clsname)
+            if isinstance(SomeClass, type) and hasattr(SomeClass, '__table__'):
+                disposeClass(SomeClass)
+                delattr(module, clsname)
+        classes = {name: createClass(tables[name], *cls, module=module, doc=options.get('doc', True), naming=naming, stats=options.get('stats')) for name in tables if name in rebuilt}
+        for ref in database.refs:
+            if ref.table1.name in rebuilt or ref.table2.name in rebuilt:
+                for table in (ref.table1, ref.table2):
+                    if table.name not in classes:
+                        classes[table.name] = getattr(module, current[table.name]['class'])
+                        removeRelationships(classes[table.name], disposed)
+                createRelation(ref, classes[ref.table1.name], classes[ref.table2.name], *cls, module=module, **options)
+        setattr(module, '__dbml__', current)
+    report['rebuilt'] = [name for name in tables if name in rebuilt]
+    return report
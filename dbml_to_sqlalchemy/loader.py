@@ -0,0 +1,180 @@
+"""
+    Load a dbml file with a cache on disk of the parsed database
+
+    the cache keeps the tables, columns, indexes, refs and enums used by
+    createModel, it is keyed by the hash of the dbml text and the version,
+    a schema split in several files is parsed by a pool of processes
+"""
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from pydbml import PyDBML, Database
+from pydbml.classes import Table, Column, Index, Reference, Enum, EnumItem, Expression
+from pydbml.parser.parser import PyDBMLParser
+from pydbml.parser.blueprints import Blueprint
+from pyparsing import ParseResults
+from pydbml.tools import remove_bom
+
+from dbml_to_sqlalchemy.main import __version__
+
+# format of the data of the cache, to change when dumpDatabase is changed
+CACHE_FORMAT = 2
+
+
+def dumpValue(val):
+    if isinstance(val, Expression):
+        return {'expression': val.text}
+    return val
+
+
+def loadValue(val):
+    if isinstance(val, dict):
+        return Expression(val['expression'])
+    return val
+
+
+def dumpDatabase(database):
+    enums = {id(enum): i for i, enum in enumerate(database.enums)}
+    tables = {id(table): i for i, table in enumerate(database.tables)}
+    return {
+        'enums': [[enum.name, enum.schema, [[item.name, item.note.text] for item in enum.items]] for enum in database.enums],
+        'tables': [{
+            'name': table.name,
+            'schema': table.schema,
+            'alias': table.alias,
+            'note': table.note.text,
+            'comment': table.comment,
+            'properties': table.properties,
+            'columns': [[col.name, {'enum': enums[id(col.type)]} if isinstance(col.type, Enum) else col.type, col.unique, col.not_null, col.pk, col.autoinc, dumpValue(col.default), col.note.text, col.properties, col.comment] for col in table.columns],
+            'indexes': [[[col.name if isinstance(col, Column) else dumpValue(col) for col in index.subjects], index.name, index.unique, index.type, index.pk, index.note.text, index.comment] for index in table.indexes],
+        } for table in database.tables],
+        'refs': [[ref.type, tables[id(ref.table1)], [col.name for col in ref.col1], tables[id(ref.table2)], [col.name for col in ref.col2], ref.name, ref.on_update, ref.on_delete, ref._inline, ref.comment] for ref in database.refs],
+    }
+
+
+def loadDatabase(data, allow_properties=False):
+    # objects are appended directly, Database.add compares every new object with
+    # all the others and the data comes from a database already validated
+    database = Database(allow_properties=allow_properties)
+    for name, schema, items in data['enums']:
+        enum = Enum(name, [EnumItem(item, note=note or None) for item, note in items], schema=schema)
+        enum.database = database
+        database.enums.append(enum)
+    for spec in data['tables']:
+        table = Table(spec['name'], schema=spec['schema'], alias=spec['alias'], note=spec['note'] or None, comment=spec['comment'], properties=spec['properties'])
+        for name, typ, unique, not_null, pk, autoinc, default, note, properties, comment in spec['columns']:
+            table.add_column(Column(name, database.enums[typ['enum']] if isinstance(typ, dict) else typ, unique=unique, not_null=not_null, pk=pk, autoinc=autoinc, default=loadValue(default), note=note or None, properties=properties, comment=comment))
+        for subjects, name, unique, typ, pk, note, comment in spec['indexes']:
+            table.add_index(Index([table[subject] if isinstance(subject, str) else loadValue(subject) for subject in subjects], name=name, unique=unique, type=typ, pk=pk, note=note or None, comment=comment))
+        table.database = database
+        database.tables.append(table)
+        database.table_dict[table.full_name] = table
+        if table.alias:
+            database.table_dict[table.alias] = table
+    for typ, table1, col1, table2, col2, name, on_update, on_delete, inline, comment in data['refs']:
+        ref = Reference(typ, [database.tables[table1][col] for col in col1], [database.tables[table2][col] for col in col2], name=name, on_update=on_update, on_delete=on_delete, inline=inline, comment=comment)
+        ref.database = database
+        database.refs.append(ref)
+    return database
+
+
+def loadDbml(path, cache_dir=None, allow_properties=False, stats=None):
+    start = time.perf_counter()
+    with open(path, encoding='utf8') as f:
+        source = f.read()
+    key = hashlib.sha256(('%s\n%s\n%s\n%s' % (__version__, CACHE_FORMAT, allow_properties, source)).encode('utf8')).hexdigest()
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(path)), '__pycache__')
+    cache = os.path.join(cache_dir, '%s.%s.json' % (os.path.basename(path), key))
+    try:
+        with open(cache, encoding='utf8') as f:
+            data = json.load(f)
+        if data['version'] == __version__ and data.get('format') == CACHE_FORMAT and data['hash'] == key:
+            database = loadDatabase(data['database'], allow_properties=allow_properties)
+            if stats is not None:
+                stats.since('cache', start)
+            return database
+    except (OSError, ValueError, KeyError):
+        pass
+    database = PyDBML(source, allow_properties=allow_properties)
+    if stats is not None:
+        stats.since('parse', start)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write then rename, workers started together can share the cache
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf8') as f:
+            json.dump({'version': __version__, 'format': CACHE_FORMAT, 'hash': key, 'database': dumpDatabase(database)}, f, separators=(',', ':'))
+        os.replace(tmp, cache)
+        # only the old caches of this file, not schema.dbml.bak.<hash>.json of schema.dbml
+        old = re.compile(r'%s\.[0-9a-f]{64}\.json' % re.escape(os.path.basename(path)))
+        for name in os.listdir(cache_dir):
+            if old.fullmatch(name) and name != os.path.basename(cache):
+                os.remove(os.path.join(cache_dir, name))
+    except OSError:
+        pass
+    return database
+
+
+class BlueprintParser(PyDBMLParser):
+    # only the syntax, the database is built after the merge of the files, it
+    # uses the internals of the parser of pydbml (pinned below 1.3 in REQUIREMENTS.txt)
+
+    def build_database(self):
+        pass
+
+
+def setParser(obj, parser):
+    # blueprints, and their columns, indexes and notes, keep the parser
+    if isinstance(obj, list):
+        for elt in obj:
+            setParser(elt, parser)
+    elif isinstance(obj, Blueprint):
+        obj.parser = parser
+        for key, val in list(vars(obj).items()):
+            if isinstance(val, ParseResults):
+                # ParseResults of pyparsing can not be pickled
+                val = list(val)
+                setattr(obj, key, val)
+            if key != 'parser':
+                setParser(val, parser)
+
+
+def parseBlueprints(path, allow_properties=False):
+    with open(path, encoding='utf8') as f:
+        parser = BlueprintParser(remove_bom(f.read()), allow_properties=allow_properties)
+    parser.parse()
+    blueprints = [parser.tables, parser.refs, parser.enums, parser.table_groups, parser.sticky_notes, parser.project]
+    # the parser has the pyparsing syntax, it is not sent back by the process
+    setParser(blueprints, None)
+    return blueprints
+
+
+def loadDbmlFiles(paths, processes=None, allow_properties=False, stats=None):
+    start = time.perf_counter()
+    if processes == 1 or len(paths) < 2:
+        results = [parseBlueprints(path, allow_properties) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(parseBlueprints, paths, [allow_properties] * len(paths)))
+    if stats is not None:
+        start = stats.since('parse', start)
+    parser = BlueprintParser('', allow_properties=allow_properties)
+    for tables, refs, enums, table_groups, sticky_notes, project in results:
+        parser.tables.extend(tables)
+        parser.refs.extend(refs)
+        parser.enums.extend(enums)
+        parser.table_groups.extend(table_groups)
+        parser.sticky_notes.extend(sticky_notes)
+        parser.project = parser.project or project
+    setParser([parser.tables, parser.refs, parser.enums, parser.table_groups, parser.sticky_notes, parser.project], parser)
+    # refs between the files are resolved by the database of all the tables
+    PyDBMLParser.build_database(parser)
+    if stats is not None:
+        stats.since('build_database', start)
+    return parser.database
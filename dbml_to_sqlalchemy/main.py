@@ -1,27 +1,61 @@
-from re import sub, search
+import re
+from re import search
+from functools import lru_cache
 import enum
+import threading
+import time
+import weakref
+from types import SimpleNamespace
 from dbml_to_sqlalchemy import mymodel
+from dbml_to_sqlalchemy.serializer import createSerializers
 
-from pydbml import PyDBML
-from sqlalchemy import PrimaryKeyConstraint, UniqueConstraint, ForeignKeyConstraint
+from sqlalchemy import PrimaryKeyConstraint, UniqueConstraint, ForeignKeyConstraint, Index, Table, text
 from sqlalchemy.sql.schema import Column
 from sqlalchemy.sql import expression
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, ColumnProperty, RelationshipProperty
 import sqlalchemy.types
 from sqlalchemy import Enum
 import sqlalchemy.sql.sqltypes
 types = {typ.lower(): getattr(sqlalchemy.types, typ) for typ in dir(sqlalchemy.types) if typ in dir(sqlalchemy.sql.sqltypes) and '_' not in typ}
 
-__version__ = '0.9.1'
+__version__ = '0.9.2'
+
+TYPE_PARAMS = re.compile(r'\((.*)\)')
+CAMEL_CHARS = re.compile('[^a-zA-Z0-9 \n]')
+CAMEL_SEPARATORS = re.compile(r"(_|-)")
+COLUMN_CHARS = re.compile('[^a-zA-Z0-9 _\n]')
+TABLE_OPTION = re.compile(r'^\s*(partition_by|shard)\s*:\s*(.+?)\s*$')
+# types of index of the dbml known by each dialect
+POSTGRESQL_USING = ('btree', 'hash', 'gist', 'spgist', 'gin', 'brin')
+MYSQL_USING = ('btree', 'hash')
+
+# a build is serialized by declarative registry, classes are published in
+# the module in one update of its dict
+locks = weakref.WeakKeyDictionary()
+locksLock = threading.Lock()
+publishLock = threading.RLock()
+
+
+def getLock(cls):
+    registry = next((base.registry for base in cls if hasattr(base, 'registry')), None)
+    if registry is None:
+        return publishLock
+    with locksLock:
+        return locks.setdefault(registry, threading.RLock())
+
+
+def publish(staging, module):
+    with publishLock:
+        vars(module).update(vars(staging))
 
 
 def toCamelCase(st):
-    st = sub('[^a-zA-Z0-9 \n]', '', st.replace('.', ' '))
-    return sub(r"(_|-)", " ", st).title().replace(" ", "")
+    st = CAMEL_CHARS.sub('', st.replace('.', ' '))
+    return CAMEL_SEPARATORS.sub(" ", st).title().replace(" ", "")
 
 
 def toColumnCase(st):
-    st = sub('[^a-zA-Z0-9 _\n]', '', st.replace('.', ' '))
+    st = COLUMN_CHARS.sub('', st.replace('.', ' '))
     return st.lower().replace(" ", "_")
 
 
@@ -29,6 +63,63 @@ def toTableCase(st):
     return st.lower().replace(" ", "_")
 
 
+class Naming:
+    # names of the classes, tables and columns from the names of the dbml,
+    # each name is computed once, toClassName, toTableName and toColumnName
+    # can be overridden for another strategy
+
+    def __init__(self):
+        self.classes = {}
+        self.tables = {}
+        self.columns = {}
+
+    def toClassName(self, name):
+        return toCamelCase(name)
+
+    def toTableName(self, name):
+        return toTableCase(name)
+
+    def toColumnName(self, name):
+        return toColumnCase(name)
+
+    def className(self, name):
+        try:
+            return self.classes[name]
+        except KeyError:
+            self.classes[name] = self.toClassName(name)
+            return self.classes[name]
+
+    def tableName(self, name):
+        try:
+            return self.tables[name]
+        except KeyError:
+            self.tables[name] = self.toTableName(name)
+            return self.tables[name]
+
+    def columnName(self, name):
+        try:
+            return self.columns[name]
+        except KeyError:
+            self.columns[name] = self.toColumnName(name)
+            return self.columns[name]
+
+    def mapping(self):
+        return {'classes': dict(self.classes), 'tables': dict(self.tables), 'columns': dict(self.columns)}
+
+
+class SnakeNaming(Naming):
+    # the classes keep the snake_case of the tables
+
+    def toClassName(self, name):
+        return toColumnCase(name)
+
+
+def getNaming(naming=None):
+    # without naming, each build has its own Naming: the names are not kept
+    # by the process after the build
+    return naming if naming is not None else Naming()
+
+
 def getType(st, default=sqlalchemy.types.String):
     if st.__class__.__name__ == 'Enum':
         return Enum
@@ -37,14 +128,31 @@ def getType(st, default=sqlalchemy.types.String):
 
 def getTypeParams(st, module):
     try:
-        if st.__class__.__name__ == 'Enum':            
+        if st.__class__.__name__ == 'Enum':
             setattr(module, st.name, enum.Enum(st.name, [item.name for item in st.items]))
             return [getattr(module, st.name), ], {"create_constraint": True}
-        return [param.isnumeric() and int(param) or param for param in search(r'\((.*)\)', st).group(0)[1:-1].split(',')], {}
+        return [param.isnumeric() and int(param) or param for param in TYPE_PARAMS.search(st).group(0)[1:-1].split(',')], {}
     except Exception:
         return [], {}
 
 
+@lru_cache(maxsize=None)
+def parseType(st):
+    return getType(st), tuple(getTypeParams(st, None)[0])
+
+
+def createType(st, module=mymodel):
+    if st.__class__.__name__ == 'Enum':
+        items = [item.name for item in st.items]
+        enumClass = getattr(module, st.name, None)
+        if not (isinstance(enumClass, enum.EnumMeta) and [item.name for item in enumClass] == items):
+            enumClass = enum.Enum(st.name, items)
+            setattr(module, st.name, enumClass)
+        return Enum(enumClass, create_constraint=True)
+    typ, args = parseType(st)
+    return typ(*args)
+
+
 def getServerDefault(val):
     if isinstance(val, bool):
         if bool is False:
@@ -56,10 +164,34 @@ def getServerDefault(val):
 
 
 def spec_many(newt, name):
-    @property
     def decorator(f):
         return [getattr(elt, name) for elt in getattr(f, newt)]
-    return decorator
+    decorator.__dbml_many__ = (newt, name)
+    return property(decorator)
+
+
+def chooseLazy(lazy, ref, cls, name, uselist=True):
+    if isinstance(lazy, dict) and '%s.%s' % (cls.__name__, name) in lazy:
+        return lazy['%s.%s' % (cls.__name__, name)]
+    # write_only and dynamic are only for collection
+    comment = ref.comment or (ref.inline and ref.col1[0].comment) or ''
+    match = search(r'lazy:\s*(\w+)', comment)
+    if match is not None and (uselist or match.group(1) not in ('write_only', 'dynamic')):
+        return match.group(1)
+    default = getattr(lazy, 'default', 'select')
+    if isinstance(lazy, dict):
+        lazy = lazy.get('*')
+    if lazy is not None and (uselist or lazy not in ('write_only', 'dynamic')):
+        return lazy
+    return default
+
+
+def getLazy(lazy, ref, cls, name, uselist=True):
+    strategy = chooseLazy(lazy, ref, cls, name, uselist=uselist)
+    # the strategy chosen, from lazy or from the comment of the ref, can be checked by lazy (asyncio)
+    if hasattr(lazy, 'check'):
+        return lazy.check(strategy, '%s.%s' % (cls.__name__, name))
+    return strategy
 
 
 def spec_doc(col):
@@ -79,65 +211,394 @@ def spec_doc(col):
     return ''
 
 
-def createModel(table, *cls, module=mymodel):
-    if len(table.note.text) == 0:
-        table.note.text = '%s Table' % toCamelCase(table.name)
-    cols = {col.name: Column(toColumnCase(col.name), getType(col.type)(*getTypeParams(col.type, module)[0], **getTypeParams(col.type, module)[1]), primary_key=col.pk, autoincrement=col.autoinc, nullable=not (col.not_null), default=col.default, server_default=getServerDefault(col.default), unique=col.unique, comment=col.note) for col in table.columns}
+class ClassDoc:
+    # __doc__ of a class, type.__doc__ calls __get__: the pieces added by the
+    # relationships are joined once on the first access
+
+    def __init__(self, text):
+        self.pieces = [text]
+
+    def append(self, text):
+        self.pieces.append(text)
+
+    def __get__(self, obj, cls=None):
+        if len(self.pieces) > 1:
+            self.pieces = [''.join(self.pieces)]
+        return self.pieces[0]
+
+
+def columnDoc(col):
+    doc = []
+    if col.primary_key:
+        doc.append('primary key')
+    if col.autoincrement is True:
+        doc.append('autoincrement')
+    if not col.nullable and not col.primary_key:
+        doc.append('not null')
+    if col.unique:
+        doc.append('unique')
+    if col.default is not None:
+        doc.append('default: %s' % col.default.arg)
+    elif col.server_default is not None:
+        doc.append('default: %s' % getattr(col.server_default.arg, 'text', col.server_default.arg))
+    if len(doc) > 0:
+        return '(%s)' % ', '.join(doc)
+    return ''
+
+
+def typeDoc(typ):
+    if getattr(typ, 'enum_class', None) is not None:
+        return typ.enum_class.__name__
+    try:
+        return str(typ).lower()
+    except Exception:
+        return typ.__class__.__name__.lower()
+
+
+class LazyDoc:
+    # shared by the classes, the text is built from the class on each access
+    # so nothing is kept by class
+
+    def __get__(self, obj, cls=None):
+        lines = []
+        for name, attr in vars(cls).items():
+            # attr.property would configure the mappers
+            prop = getattr(getattr(attr, 'comparator', None), 'prop', None)
+            if isinstance(prop, ColumnProperty):
+                lines.append(":param %s: %s %s\n:type %s: %s" % (name, prop.columns[0].comment or '', columnDoc(prop.columns[0]), name, typeDoc(prop.columns[0].type)))
+            elif isinstance(prop, RelationshipProperty):
+                lines.append(":param %s:\n:type %s: relationship(%s)" % (name, name, getattr(prop.argument, '__name__', prop.argument)))
+            elif isinstance(attr, property) and hasattr(attr.fget, '__dbml_many__'):
+                lines.append(":param %s:\n:type %s: relationship(%s)" % (name, name, attr.fget.__dbml_many__[1]))
+        return "%s\n\n%s" % (vars(cls).get('__dbml_note__') or '%s Table' % cls.__name__, '\n'.join(lines))
+
+
+lazyDoc = LazyDoc()
+
+
+def createDoc(doc, text):
+    # text is a function, it is only called for a docstring built now
+    if doc == 'lazy':
+        return lazyDoc
+    if doc:
+        return ClassDoc(text())
+    return None
+
+
+def addDoc(SomeClass, text):
+    doc = vars(SomeClass).get('__doc__')
+    if isinstance(doc, ClassDoc):
+        doc.append(text)
+
+
+def createIndexes(table, cols, naming=None):
+    naming = getNaming(naming)
     tableArgs = []
     for index in [index for index in table.indexes if index.pk is True]:
         tableArgs.append(PrimaryKeyConstraint(*[cols[col.name] for col in index.subjects]))
-    for index in [index for index in table.indexes if index.unique is True]:
-        subargs = {}
-        if index.name is not None:
-            subargs = {'name': index.name}
-        tableArgs.append(UniqueConstraint(*[cols[col.name] for col in index.subjects], **subargs))
-    SomeClass = type(toCamelCase(table.name), cls, {
-        "__tablename__": toTableCase(table.name),
+    for index in [index for index in table.indexes if index.pk is not True]:
+        subjects = [cols[col.name] if col.__class__.__name__ == 'Column' else text(col.text) for col in index.subjects]
+        if index.unique is True and index.type is None and all(col.__class__.__name__ == 'Column' for col in index.subjects):
+            subargs = {}
+            if index.name is not None:
+                subargs = {'name': index.name}
+            tableArgs.append(UniqueConstraint(*subjects, **subargs))
+            continue
+        subargs = {'unique': index.unique is True}
+        if index.type is not None and index.type.lower() in POSTGRESQL_USING:
+            subargs['postgresql_using'] = index.type
+        if index.type is not None and index.type.lower() in MYSQL_USING:
+            subargs['mysql_using'] = index.type
+        name = index.name or "ix_%s_%s" % (naming.tableName(table.name), "_".join([naming.columnName(getattr(col, 'name', None) or col.text) for col in index.subjects]))
+        tableArgs.append(Index(name, *subjects, **subargs))
+    return tableArgs
+
+
+def addTableArgs(SomeClass, *args):
+    # the dict of kwargs stays at the end of __table_args__
+    tableArgs = SomeClass.__table_args__
+    if len(tableArgs) > 0 and isinstance(tableArgs[-1], dict):
+        SomeClass.__table_args__ = tableArgs[:-1] + args + tableArgs[-1:]
+    else:
+        SomeClass.__table_args__ = tableArgs + args
+
+
+def addForeignKey(SomeClass, columns, OtherClass, others, name=None):
+    # the referred columns are given by name, so the foreign key follows the new
+    # table of a class rebuilt by updateModels, a foreign key already there is kept
+    refcolumns = ['%s.%s' % (OtherClass.__table__.key, col) for col in others]
+    for constraint in SomeClass.__table__.foreign_key_constraints:
+        if [fk.parent.key for fk in constraint.elements] == columns and [fk.target_fullname for fk in constraint.elements] == refcolumns:
+            return
+    addTableArgs(SomeClass, ForeignKeyConstraint([getattr(SomeClass, col) for col in columns], refcolumns, name=name))
+
+
+def createIndexFk(SomeClass, columns):
+    table = SomeClass.__table__
+    names = [getattr(SomeClass, col).expression.name for col in columns]
+    # the first columns of the primary key or of an index are already indexed
+    for other in [[col.name for col in table.primary_key.columns]] + [[col.name for col in index.expressions if hasattr(col, 'name')] for index in table.indexes]:
+        if other[:len(names)] == names:
+            return
+    addTableArgs(SomeClass, Index("ix_%s_%s" % (table.name, "_".join(names)), *[getattr(SomeClass, col) for col in columns]))
+
+
+def getTableOptions(table):
+    # settings of the table (allow_properties) or lines "partition_by: ..." of the note
+    options = {}
+    for line in table.note.text.splitlines():
+        match = TABLE_OPTION.match(line)
+        if match is not None:
+            options[match.group(1)] = match.group(2)
+    options.update({key: val for key, val in (getattr(table, 'properties', None) or {}).items() if key in ('partition_by', 'shard')})
+    return options
+
+
+def createTableKwargs(options):
+    kwargs = {}
+    if 'partition_by' in options:
+        kwargs['postgresql_partition_by'] = options['partition_by']
+    if 'shard' in options:
+        kwargs['info'] = {'shard': options['shard'], 'bind_key': options['shard']}
+    return kwargs
+
+
+def createColumns(table, module=mymodel, naming=None):
+    naming = getNaming(naming)
+    return {col.name: Column(naming.columnName(col.name), createType(col.type, module), primary_key=col.pk, autoincrement=col.autoinc, nullable=not (col.not_null), default=col.default, server_default=getServerDefault(col.default), unique=col.unique, comment=col.note.text or None) for col in table.columns}
+
+
+def createClass(table, *cls, module=mymodel, doc=True, naming=None, stats=None):
+    naming = getNaming(naming)
+    if stats is not None:
+        start = time.perf_counter()
+    if len(table.note.text) == 0:
+        table.note.text = '%s Table' % naming.className(table.name)
+    cols = createColumns(table, module, naming=naming)
+    tableArgs = createIndexes(table, cols, naming=naming)
+    options = getTableOptions(table)
+    kwargs = createTableKwargs(options)
+    if len(kwargs) > 0:
+        tableArgs.append(kwargs)
+    if stats is not None:
+        start = stats.since('columns', start, table=table.name)
+    SomeClass = type(naming.className(table.name), cls, {
+        "__tablename__": naming.tableName(table.name),
         "__table_args__": tuple(tableArgs),
-        "__doc__": "%s\n\n%s" % (table.note, '\n'.join([":param %s: %s %s\n:type %s: %s" % (col.name, col.note, spec_doc(col), col.name, col.type) for col in table.columns])),
+        # used by flask-sqlalchemy for select the bind of the table
+        **({"__bind_key__": options['shard']} if 'shard' in options else {}),
+        "__doc__": createDoc(doc, lambda: "%s\n\n%s" % (table.note, '\n'.join([":param %s: %s %s\n:type %s: %s" % (col.name, col.note, spec_doc(col), col.name, col.type) for col in table.columns]))),
+        **({"__dbml_note__": table.note.text} if doc == 'lazy' else {}),
+        **createSerializers(list(cols), [col.key for col in cols.values()]),
         **cols
     })
-    setattr(module, toCamelCase(table.name), SomeClass)
-    for ref in [ref for ref in table.database.refs if (ref.table1 == table or ref.table2 == table) and getattr(module, toCamelCase(ref.col2[0].table.name), None) is not None and getattr(module, toCamelCase(ref.col1[0].table.name), None) is not None]:
-        class1 = getattr(module, toCamelCase(ref.table1.name))
-        class2 = getattr(module, toCamelCase(ref.table2.name))
-        if ref.type in ('<'):
-            class2.__table_args__ = class2.__table_args__ + (ForeignKeyConstraint([getattr(class2, col.name) for col in ref.col2], [getattr(class1, col.name) for col in ref.col1], name=ref.name), )
-        if ref.type in ('>', '-'):
-            class1.__table_args__ = class1.__table_args__ + (ForeignKeyConstraint([getattr(class1, col.name) for col in ref.col1], [getattr(class2, col.name) for col in ref.col2], name=ref.name), )
-        if ref.type == '<':
-            setattr(class1, "%ss" % class2.__name__.lower(), relationship(class2.__name__, back_populates=class1.__name__.lower()))
-            class1.__doc__ = class1.__doc__ + "\n:param %ss:\n:type %ss: relationship(%s)" % (class2.__name__.lower(), class2.__name__.lower(), class2.__name__)
-            setattr(class2, class1.__name__.lower(), relationship(class1.__name__, back_populates="%ss" % class2.__name__.lower()))
-            class2.__doc__ = class2.__doc__ + "\n:param %s :\n:type %s: %s" % (class1.__name__.lower(), class1.__name__.lower(), class1.__name__)
-        elif ref.type == '>':
-            setattr(class1, class2.__name__.lower(), relationship(class2.__name__, back_populates="%ss" % class1.__name__.lower()))
-            class1.__doc__ = class1.__doc__ + "\n:param %s:\n:type %s: %s" % (class2.__name__.lower(), class2.__name__.lower(), class2.__name__)
-            setattr(class2, "%ss" % class1.__name__.lower(), relationship(class1.__name__, back_populates=class2.__name__.lower()))
-            class2.__doc__ = class2.__doc__ + "\n:param %ss:\n:type %ss: relationship(%s):" % (class1.__name__.lower(), class1.__name__.lower(), class1.__name__)
-        elif ref.type == '-':
-            setattr(class1, class2.__name__.lower(), relationship(class2.__name__, uselist=False, back_populates=class1.__name__.lower()))
-            setattr(class2, class1.__name__.lower(), relationship(class1.__name__, uselist=False, back_populates=class2.__name__.lower()))
-        if ref.type == '<>':
-            newt_name = "%s_%s" % (ref.table1.name, ref.table2.name)
-            newt_col1 = "\n".join(["%s_%s %s" % (col.table.name, col.name, col.type) for col in ref.col1])
-            newt_col2 = "\n".join(["%s_%s %s" % (col.table.name, col.name, col.type) for col in ref.col2])
-            newt_pk = "%s, %s" % ("\n".join(["%s_%s" % (col.table.name, col.name) for col in ref.col1]), "\n".join(["%s_%s" % (col.table.name, col.name) for col in ref.col2]))
-            new_table = "Table %s\n{\n%s\n%s\nindexes {\n(%s) [pk]\n}\n}" % (newt_name, newt_col1, newt_col2, newt_pk)
-            newt = createModel(PyDBML(new_table).tables[0], *cls, module=module)
-            newt.__table_args__ = newt.__table_args__ + (ForeignKeyConstraint([getattr(newt, "%s_%s" % (col.table.name, col.name)) for col in ref.col1], [getattr(class1, col.name) for col in ref.col1]), )
-            newt.__table_args__ = newt.__table_args__ + (ForeignKeyConstraint([getattr(newt, "%s_%s" % (col.table.name, col.name)) for col in ref.col2], [getattr(class2, col.name) for col in ref.col2]), )
-            setattr(class1, "%ss" % newt.__name__.lower(), relationship(newt.__name__, back_populates=class1.__name__.lower()))
-            class1.__doc__ = class1.__doc__ + "\n:param %ss:\n:type %ss: relationship(%s)" % (newt.__name__.lower(), newt.__name__.lower(), newt.__name__)
-            setattr(newt, class1.__name__.lower(), relationship(class1.__name__, back_populates="%ss" % newt.__name__.lower()))
-            newt.__doc__ = newt.__doc__ + "\n:param %s:\n:type %s: %s" % (class1.__name__.lower(), class1.__name__.lower(), class1.__name__)
-            setattr(class2, "%ss" % newt.__name__.lower(), relationship(newt.__name__, back_populates=class2.__name__.lower()))
-            class2.__doc__ = class2.__doc__ + "\n:param %ss:\n:type %ss: relationship(%s):" % (newt.__name__.lower(), newt.__name__.lower(), newt.__name__)
-            setattr(newt, class2.__name__.lower(), relationship(class2.__name__, back_populates="%ss" % newt.__name__.lower()))
-            newt.__doc__ = newt.__doc__ + "\n:param %s:\n:type %s: %s:" % (class2.__name__.lower(), class2.__name__.lower(), class2.__name__)
+    if stats is not None:
+        stats.since('mapping', start, table=table.name)
+        stats.count('tables')
+        stats.built(SomeClass)
+    setattr(module, SomeClass.__name__, SomeClass)
+    return SomeClass
+
+
+def createAssociation(ref, *cls, module=mymodel, doc=True, naming=None):
+    naming = getNaming(naming)
+    newt_name = "%s_%s" % (ref.table1.name, ref.table2.name)
+    cols = {"%s_%s" % (col.table.name, col.name): Column(naming.columnName("%s_%s" % (col.table.name, col.name)), createType(col.type, module), autoincrement=False) for col in ref.col1 + ref.col2}
+    newt = type(naming.className(newt_name), cls, {
+        "__tablename__": naming.tableName(newt_name),
+        "__table_args__": (PrimaryKeyConstraint(*cols.values()), ),
+        "__doc__": createDoc(doc, lambda: "%s Table\n\n%s" % (naming.className(newt_name), '\n'.join([":param %s_%s:  \n:type %s_%s: %s" % (col.table.name, col.name, col.table.name, col.name, col.type) for col in ref.col1 + ref.col2]))),
+        **createSerializers(list(cols), [col.key for col in cols.values()]),
+        **cols
+    })
+    setattr(module, newt.__name__, newt)
+    return newt
+
+
+def createRelation(ref, class1, class2, *cls, module=mymodel, secondary=True, lazy=None, index_fk=False, doc=True, naming=None, stats=None):
+    naming = getNaming(naming)
+    if stats is not None:
+        start = time.perf_counter()
+    if ref.type in ('<'):
+        addForeignKey(class2, [col.name for col in ref.col2], class1, [col.name for col in ref.col1], name=ref.name)
+        if index_fk:
+            createIndexFk(class2, [col.name for col in ref.col2])
+    if ref.type in ('>', '-'):
+        addForeignKey(class1, [col.name for col in ref.col1], class2, [col.name for col in ref.col2], name=ref.name)
+        if index_fk:
+            createIndexFk(class1, [col.name for col in ref.col1])
+    if ref.type == '<':
+        setattr(class1, "%ss" % class2.__name__.lower(), relationship(class2.__name__, back_populates=class1.__name__.lower(), lazy=getLazy(lazy, ref, class1, "%ss" % class2.__name__.lower())))
+        addDoc(class1, "\n:param %ss:\n:type %ss: relationship(%s)" % (class2.__name__.lower(), class2.__name__.lower(), class2.__name__))
+        setattr(class2, class1.__name__.lower(), relationship(class1.__name__, back_populates="%ss" % class2.__name__.lower(), lazy=getLazy(lazy, ref, class2, class1.__name__.lower(), uselist=False)))
+        addDoc(class2, "\n:param %s :\n:type %s: %s" % (class1.__name__.lower(), class1.__name__.lower(), class1.__name__))
+    elif ref.type == '>':
+        setattr(class1, class2.__name__.lower(), relationship(class2.__name__, back_populates="%ss" % class1.__name__.lower(), lazy=getLazy(lazy, ref, class1, class2.__name__.lower(), uselist=False)))
+        addDoc(class1, "\n:param %s:\n:type %s: %s" % (class2.__name__.lower(), class2.__name__.lower(), class2.__name__))
+        setattr(class2, "%ss" % class1.__name__.lower(), relationship(class1.__name__, back_populates=class2.__name__.lower(), lazy=getLazy(lazy, ref, class2, "%ss" % class1.__name__.lower())))
+        addDoc(class2, "\n:param %ss:\n:type %ss: relationship(%s):" % (class1.__name__.lower(), class1.__name__.lower(), class1.__name__))
+    elif ref.type == '-':
+        setattr(class1, class2.__name__.lower(), relationship(class2.__name__, uselist=False, back_populates=class1.__name__.lower(), lazy=getLazy(lazy, ref, class1, class2.__name__.lower(), uselist=False)))
+        setattr(class2, class1.__name__.lower(), relationship(class1.__name__, uselist=False, back_populates=class2.__name__.lower(), lazy=getLazy(lazy, ref, class2, class1.__name__.lower(), uselist=False)))
+    if ref.type == '<>':
+        if stats is not None:
+            middle = time.perf_counter()
+        newt = createAssociation(ref, *cls, module=module, doc=doc, naming=naming)
+        if stats is not None:
+            # the time of the associations is also in the time of the relationships
+            stats.since('associations', middle, table=ref.table1.name)
+            stats.count('associations')
+            stats.built(newt)
+        addForeignKey(newt, ["%s_%s" % (col.table.name, col.name) for col in ref.col1], class1, [col.name for col in ref.col1])
+        addForeignKey(newt, ["%s_%s" % (col.table.name, col.name) for col in ref.col2], class2, [col.name for col in ref.col2])
+        if index_fk:
+            createIndexFk(newt, ["%s_%s" % (col.table.name, col.name) for col in ref.col2])
+        setattr(class1, "%ss" % newt.__name__.lower(), relationship(newt.__name__, back_populates=class1.__name__.lower(), lazy=getLazy(lazy, ref, class1, "%ss" % newt.__name__.lower())))
+        addDoc(class1, "\n:param %ss:\n:type %ss: relationship(%s)" % (newt.__name__.lower(), newt.__name__.lower(), newt.__name__))
+        setattr(newt, class1.__name__.lower(), relationship(class1.__name__, back_populates="%ss" % newt.__name__.lower(), lazy=getLazy(lazy, ref, newt, class1.__name__.lower(), uselist=False)))
+        addDoc(newt, "\n:param %s:\n:type %s: %s" % (class1.__name__.lower(), class1.__name__.lower(), class1.__name__))
+        setattr(class2, "%ss" % newt.__name__.lower(), relationship(newt.__name__, back_populates=class2.__name__.lower(), lazy=getLazy(lazy, ref, class2, "%ss" % newt.__name__.lower())))
+        addDoc(class2, "\n:param %ss:\n:type %ss: relationship(%s):" % (newt.__name__.lower(), newt.__name__.lower(), newt.__name__))
+        setattr(newt, class2.__name__.lower(), relationship(class2.__name__, back_populates="%ss" % newt.__name__.lower(), lazy=getLazy(lazy, ref, newt, class2.__name__.lower(), uselist=False)))
+        addDoc(newt, "\n:param %s:\n:type %s: %s:" % (class2.__name__.lower(), class2.__name__.lower(), class2.__name__))
+        if secondary:
+            setattr(class1, "%ss" % class2.__name__.lower(), relationship(class2.__name__, secondary=newt.__table__, viewonly=True, lazy=getLazy(lazy, ref, class1, "%ss" % class2.__name__.lower())))
+            setattr(class2, "%ss" % class1.__name__.lower(), relationship(class1.__name__, secondary=newt.__table__, viewonly=True, lazy=getLazy(lazy, ref, class2, "%ss" % class1.__name__.lower())))
+        else:
             setattr(class1, "%ss" % class2.__name__.lower(), spec_many("%ss" % newt.__name__.lower(), class2.__name__.lower()))
-            class1.__doc__ = class1.__doc__ + "\n:param %ss:\n:type %ss: relationship(%s)" % (class2.__name__.lower(), class2.__name__.lower(), class2.__name__)
             setattr(class2, "%ss" % class1.__name__.lower(), spec_many("%ss" % newt.__name__.lower(), class1.__name__.lower()))
-            class2.__doc__ = class2.__doc__ + "\n:param %ss:\n:type %ss: relationship(%s)" % (class1.__name__.lower(), class1.__name__.lower(), class1.__name__)
-            setattr(module, newt.__name__, newt)
-    return getattr(module, toCamelCase(table.name))
+        addDoc(class1, "\n:param %ss:\n:type %ss: relationship(%s)" % (class2.__name__.lower(), class2.__name__.lower(), class2.__name__))
+        addDoc(class2, "\n:param %ss:\n:type %ss: relationship(%s)" % (class1.__name__.lower(), class1.__name__.lower(), class1.__name__))
+        setattr(module, newt.__name__, newt)
+    if stats is not None:
+        stats.since('relationships', start, table=ref.table1.name)
+
+
+def createModel(table, *cls, module=mymodel, secondary=True, lazy=None, index_fk=False, doc=True, naming=None, stats=None):
+    naming = getNaming(naming)
+    with getLock(cls), publishLock:
+        SomeClass = createClass(table, *cls, module=module, doc=doc, naming=naming, stats=stats)
+        if stats is not None:
+            start = time.perf_counter()
+        refs = [ref for ref in table.database.refs if (ref.col1[0].table is table or ref.col2[0].table is table) and getattr(module, naming.className(ref.col2[0].table.name), None) is not None and getattr(module, naming.className(ref.col1[0].table.name), None) is not None]
+        if stats is not None:
+            stats.since('scan', start, table=table.name)
+            stats.count('refs_scanned', len(table.database.refs))
+            stats.count('refs_matched', len(refs))
+        for ref in refs:
+            createRelation(ref, getattr(module, naming.className(ref.table1.name)), getattr(module, naming.className(ref.table2.name)), *cls, module=module, secondary=secondary, lazy=lazy, index_fk=index_fk, doc=doc, naming=naming, stats=stats)
+        return SomeClass
+
+
+def createModels(database, *cls, module=mymodel, secondary=True, lazy=None, index_fk=False, doc=True, naming=None, stats=None):
+    naming = getNaming(naming)
+    staging = SimpleNamespace()
+    if stats is not None:
+        # each ref is used once, there is no scan
+        stats.count('refs_scanned', len(database.refs))
+        stats.count('refs_matched', len(database.refs))
+    with getLock(cls):
+        classes = {id(table): createClass(table, *cls, module=staging, doc=doc, naming=naming, stats=stats) for table in database.tables}
+        for ref in database.refs:
+            createRelation(ref, classes[id(ref.table1)], classes[id(ref.table2)], *cls, module=staging, secondary=secondary, lazy=lazy, index_fk=index_fk, doc=doc, naming=naming, stats=stats)
+    publish(staging, module)
+    return [classes[id(table)] for table in database.tables]
+
+
+def createTableRelation(ref, metadata, module=mymodel, naming=None):
+    naming = getNaming(naming)
+    # only the foreign keys and the association table of the ref, without relationship
+    table1 = metadata.tables[naming.tableName(ref.table1.name)]
+    table2 = metadata.tables[naming.tableName(ref.table2.name)]
+    if ref.type == '<':
+        table2.append_constraint(ForeignKeyConstraint([table2.c[naming.columnName(col.name)] for col in ref.col2], [table1.c[naming.columnName(col.name)] for col in ref.col1], name=ref.name))
+    if ref.type in ('>', '-'):
+        table1.append_constraint(ForeignKeyConstraint([table1.c[naming.columnName(col.name)] for col in ref.col1], [table2.c[naming.columnName(col.name)] for col in ref.col2], name=ref.name))
+    if ref.type == '<>':
+        cols = [Column(naming.columnName("%s_%s" % (col.table.name, col.name)), createType(col.type, module), autoincrement=False) for col in ref.col1 + ref.col2]
+        Table(naming.tableName("%s_%s" % (ref.table1.name, ref.table2.name)), metadata, *cols,
+              PrimaryKeyConstraint(*cols),
+              ForeignKeyConstraint(cols[:len(ref.col1)], [table1.c[naming.columnName(col.name)] for col in ref.col1]),
+              ForeignKeyConstraint(cols[len(ref.col1):], [table2.c[naming.columnName(col.name)] for col in ref.col2]))
+
+
+def buildTable(table, metadata, module=mymodel, naming=None):
+    naming = getNaming(naming)
+    cols = createColumns(table, module, naming=naming)
+    return Table(naming.tableName(table.name), metadata, *cols.values(), *createIndexes(table, cols, naming=naming), **createTableKwargs(getTableOptions(table)))
+
+
+def createTable(table, metadata, module=mymodel, naming=None):
+    naming = getNaming(naming)
+    someTable = buildTable(table, metadata, module=module, naming=naming)
+    for ref in [ref for ref in table.database.refs if (ref.col1[0].table is table or ref.col2[0].table is table) and naming.tableName(ref.table1.name) in metadata.tables and naming.tableName(ref.table2.name) in metadata.tables]:
+        createTableRelation(ref, metadata, module=module, naming=naming)
+    return someTable
+
+
+def createTables(database, metadata, module=mymodel, naming=None):
+    naming = getNaming(naming)
+    tables = [buildTable(table, metadata, module=module, naming=naming) for table in database.tables]
+    for ref in database.refs:
+        createTableRelation(ref, metadata, module=module, naming=naming)
+    return tables
+
+
+class LazyModels:
+    # installed as __getattr__ of the module, a class is built when it is
+    # used the first time with the classes needed by its relationships
+
+    def __init__(self, database, *cls, module=mymodel, **options):
+        self.cls = cls
+        self.module = module
+        self.options = options
+        self.staging = SimpleNamespace()
+        self.published = set()
+        options['naming'] = getNaming(options.get('naming'))
+        self.tables = {options['naming'].className(table.name): table for table in database.tables}
+        self.classes = {}
+        self.pending = {id(table): [] for table in database.tables}
+        for ref in database.refs:
+            self.pending[id(ref.table1)].append(ref)
+            if ref.table2 is not ref.table1:
+                self.pending[id(ref.table2)].append(ref)
+        self.fallback = vars(module).get('__getattr__')
+
+    def __call__(self, name):
+        if name not in self.tables:
+            if self.fallback is not None:
+                return self.fallback(name)
+            raise AttributeError("module %r has no attribute %r" % (getattr(self.module, '__name__', self.module), name))
+        with getLock(self.cls):
+            if id(self.tables[name]) in self.classes and len(self.pending[id(self.tables[name])]) == 0:
+                # built by another thread
+                return self.classes[id(self.tables[name])]
+            return self.build(self.tables[name])
+
+    def getClass(self, table):
+        if id(table) not in self.classes:
+            self.classes[id(table)] = createClass(table, *self.cls, module=self.staging, doc=self.options.get('doc', True), naming=self.options['naming'], stats=self.options.get('stats'))
+        return self.classes[id(table)]
+
+    def build(self, table):
+        SomeClass = self.getClass(table)
+        if self.options.get('stats') is not None:
+            self.options['stats'].count('refs_scanned', len(self.pending[id(table)]))
+            self.options['stats'].count('refs_matched', len(self.pending[id(table)]))
+        for ref in self.pending[id(table)]:
+            createRelation(ref, self.getClass(ref.table1), self.getClass(ref.table2), *self.cls, module=self.staging, **self.options)
+            other = ref.table2 if ref.table1 is table else ref.table1
+            self.pending[id(other)] = [elt for elt in self.pending[id(other)] if elt is not ref]
+        self.pending[id(table)] = []
+        # classes with refs not created stay in staging until they are used
+        unfinished = set(self.classes[key].__name__ for key in self.classes if len(self.pending[key]) > 0)
+        ready = SimpleNamespace(**{name: obj for name, obj in vars(self.staging).items() if name not in unfinished and name not in self.published})
+        publish(ready, self.module)
+        self.published.update(vars(ready))
+        return SomeClass
+
+
+def createLazyModels(database, *cls, module=mymodel, **options):
+    registry = LazyModels(database, *cls, module=module, **options)
+    setattr(module, '__getattr__', registry)
+    return registry
@@ -0,0 +1,68 @@
+"""
+    Child partitions and shards of the tables of the Model Class
+
+    a table with the setting (or the line of note) partition_by is created by
+    postgresql as a partitioned table, its partitions are created by the DDL
+    "CREATE TABLE ... PARTITION OF ... FOR VALUES" after the parent table
+"""
+from sqlalchemy import event, literal
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import DDL
+
+BOUNDS = ('MINVALUE', 'MAXVALUE')
+
+
+def getTable(model):
+    return getattr(model, '__table__', model)
+
+
+def renderBound(val, dialect):
+    if isinstance(val, str) and val.upper() in BOUNDS:
+        return val.upper()
+    return str(literal(val).compile(dialect=dialect, compile_kwargs={'literal_binds': True}))
+
+
+def renderValues(strategy, bounds, dialect):
+    if bounds == 'default':
+        return 'DEFAULT'
+    if strategy == 'range':
+        start, end = bounds
+        start = start if isinstance(start, (tuple, list)) else (start, )
+        end = end if isinstance(end, (tuple, list)) else (end, )
+        return 'FOR VALUES FROM (%s) TO (%s)' % (', '.join(renderBound(val, dialect) for val in start), ', '.join(renderBound(val, dialect) for val in end))
+    if strategy == 'list':
+        return 'FOR VALUES IN (%s)' % ', '.join(renderBound(val, dialect) for val in bounds)
+    if strategy == 'hash':
+        modulus, remainder = bounds
+        return 'FOR VALUES WITH (MODULUS %d, REMAINDER %d)' % (modulus, remainder)
+    raise ValueError("partition strategy %r is not range, list or hash" % strategy)
+
+
+def createPartitions(model, partitions, attach=True):
+    # partitions: {name: (start, end)} for range, {name: [values]} for list,
+    # {name: (modulus, remainder)} for hash, {name: 'default'}
+    table = getTable(model)
+    partitionBy = table.dialect_options['postgresql']['partition_by']
+    if partitionBy is None:
+        raise ValueError("table %s has no partition_by" % table.name)
+    strategy = partitionBy.split('(')[0].strip().lower()
+    # named paramstyle, % of the values is escaped once by the DDL
+    dialect = postgresql.dialect(paramstyle='named')
+    preparer = dialect.identifier_preparer
+    ddls = []
+    for name, bounds in partitions.items():
+        child = preparer.quote(name) if table.schema is None else '%s.%s' % (preparer.quote_schema(table.schema), preparer.quote(name))
+        ddl = DDL(('CREATE TABLE %s PARTITION OF %s %s' % (child, preparer.format_table(table), renderValues(strategy, bounds, dialect))).replace('%', '%%'))
+        if attach:
+            event.listen(table, 'after_create', ddl.execute_if(dialect='postgresql'))
+        ddls.append(ddl)
+    return ddls
+
+
+def getShard(model):
+    return getTable(model).info.get('shard')
+
+
+def shardChooser(mapper, instance, clause=None):
+    # shard_chooser of sqlalchemy.ext.horizontal_shard.ShardedSession
+    return getShard(mapper.local_table)
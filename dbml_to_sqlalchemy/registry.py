@@ -0,0 +1,59 @@
+"""
+    Registry of Model Class isolated from the module mymodel
+
+    each registry has its own declarative Base, MetaData and namespace of
+    classes and enums, it can be disposed for free the classes
+"""
+from types import ModuleType
+
+import sqlalchemy as db
+from sqlalchemy.orm import DeclarativeBase
+
+from dbml_to_sqlalchemy.main import createModel, createModels, createLazyModels, Naming
+from dbml_to_sqlalchemy.warmup import warmup
+
+
+def createBase(*mixins, metadata=None):
+    metadata = metadata if metadata is not None else db.MetaData()
+    return type('Base', mixins + (DeclarativeBase, ), {'metadata': metadata})
+
+
+class Registry:
+
+    def __init__(self, *mixins, name='models', metadata=None, naming=None):
+        self.Base = createBase(*mixins, metadata=metadata)
+        self.metadata = self.Base.metadata
+        self.models = ModuleType(name)
+        self.naming = naming if naming is not None else Naming()
+
+    def __getattr__(self, name):
+        if name in ('Base', 'metadata', 'models', 'naming'):
+            raise AttributeError(name)
+        return getattr(self.models, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.dispose()
+
+    def createModel(self, table, **options):
+        options.setdefault('naming', self.naming)
+        return createModel(table, self.Base, module=self.models, **options)
+
+    def createModels(self, database, **options):
+        options.setdefault('naming', self.naming)
+        return createModels(database, self.Base, module=self.models, **options)
+
+    def createLazyModels(self, database, **options):
+        options.setdefault('naming', self.naming)
+        return createLazyModels(database, self.Base, module=self.models, **options)
+
+    def warmup(self, bind=None, freeze=False):
+        return warmup(self.Base, module=self.models, bind=bind, freeze=freeze)
+
+    def dispose(self):
+        self.Base.registry.dispose()
+        self.metadata.clear()
+        for name in [name for name in vars(self.models) if not name.startswith('__') or name in ('__getattr__', '__dbml__')]:
+            delattr(self.models, name)
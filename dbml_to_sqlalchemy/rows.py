@@ -0,0 +1,61 @@
+"""
+    Read only Row Class of the tables
+
+    a named tuple by table is built from the same dbml table as createModel,
+    the rows of sqlalchemy Core are fetched in these tuples: no identity map,
+    no state and no __dict__ by row, for read a lot of rows
+"""
+from collections import namedtuple
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.expression import Executable
+
+from dbml_to_sqlalchemy import mymodel
+from dbml_to_sqlalchemy.main import getNaming
+from dbml_to_sqlalchemy.bulk import getTable
+
+
+def createRow(table, module=mymodel, naming=None):
+    naming = getNaming(naming)
+    columns = [naming.columnName(col.name) for col in table.columns]
+    # rename: a name which is not an identifier becomes _0, _1, ...
+    base = namedtuple("%sRow" % naming.className(table.name), columns, rename=True)
+    RowClass = type(base.__name__, (base, ), {
+        "__slots__": (),
+        "__doc__": "%s (read only)" % (table.note.text or '%s Table' % naming.className(table.name)),
+        "__tablename__": naming.tableName(table.name),
+        "__dbml_columns__": tuple(columns),
+    })
+    setattr(module, RowClass.__name__, RowClass)
+    return RowClass
+
+
+def createRows(database, module=mymodel, naming=None):
+    naming = getNaming(naming)
+    return [createRow(table, module=module, naming=naming) for table in database.tables]
+
+
+def selectRows(RowClass, model):
+    # select of the columns in the order of the fields of the row class
+    table = getTable(model)
+    return select(*[table.c[name] for name in RowClass.__dbml_columns__])
+
+
+def fetchRows(bind, RowClass, statement):
+    # statement is a select of the columns in the order of the row class, a Table or a Model Class
+    if not isinstance(statement, Executable):
+        statement = selectRows(RowClass, statement)
+    if isinstance(bind, Engine):
+        with bind.connect() as connection:
+            return fetchRows(connection, RowClass, statement)
+    return list(map(RowClass._make, bind.execute(statement)))
+
+
+def iterRows(connection, RowClass, statement, batch=10000):
+    # rows are read by batch of the cursor (yield_per), the connection stays open while the iteration
+    if not isinstance(statement, Executable):
+        statement = selectRows(RowClass, statement)
+    make = RowClass._make
+    for rows in connection.execute(statement.execution_options(yield_per=batch)).partitions():
+        yield from map(make, rows)
@@ -0,0 +1,58 @@
+"""
+    Serializers of the Model Class
+
+    to_dict, from_dict and to_dicts are added to each class, the values of the
+    columns are read by an attrgetter (itemgetter for the rows) built once by
+    class from the columns of the dbml
+"""
+from operator import attrgetter, itemgetter
+
+
+def createGetter(getter, size):
+    # attrgetter and itemgetter of one name return the value, not a tuple
+    if size == 1:
+        return lambda obj: (getter(obj), )
+    return getter
+
+
+def toDict(self, depth=0):
+    cls = type(self)
+    data = dict(zip(cls.__dbml_columns__, cls.__dbml_getter__(self)))
+    if depth > 0:
+        for rel in cls.__mapper__.relationships:
+            value = getattr(self, rel.key)
+            if value is None:
+                data[rel.key] = None
+            elif rel.uselist:
+                data[rel.key] = [elt.to_dict(depth - 1) for elt in value]
+            else:
+                data[rel.key] = value.to_dict(depth - 1)
+    return data
+
+
+def fromDict(cls, data):
+    return cls(**{name: data[name] for name in cls.__dbml_columns__ if name in data})
+
+
+def toDicts(cls, rows, depth=0):
+    # objects of the class, rows of select(Class) or rows of the columns of the table
+    result = []
+    for row in rows:
+        if isinstance(row, cls):
+            result.append(row.to_dict(depth))
+        elif len(row) == 1 and isinstance(row[0], cls):
+            result.append(row[0].to_dict(depth))
+        else:
+            result.append(dict(zip(cls.__dbml_columns__, cls.__dbml_keys__(row._mapping))))
+    return result
+
+
+def createSerializers(names, keys):
+    return {
+        '__dbml_columns__': tuple(names),
+        '__dbml_getter__': staticmethod(createGetter(attrgetter(*names), len(names))),
+        '__dbml_keys__': staticmethod(createGetter(itemgetter(*keys), len(keys))),
+        'to_dict': toDict,
+        'from_dict': classmethod(fromDict),
+        'to_dicts': classmethod(toDicts),
+    }
@@ -0,0 +1,57 @@
+"""
+    Statistics of the build of the Model Class
+
+    a BuildStats given by the parameter stats records the time of each phase
+    (parse, columns, mapping, scan, relationships, associations) by table and
+    the counters of refs, associations and mappers configured
+"""
+import json
+import time
+import weakref
+
+COUNTERS = ('tables', 'refs_scanned', 'refs_matched', 'associations', 'mappers_configured')
+
+
+class BuildStats:
+
+    def __init__(self):
+        self.phases = {}
+        self.tables = {}
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self.mappers = weakref.WeakSet()
+
+    def add(self, phase, seconds, table=None):
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+        if table is not None:
+            times = self.tables.setdefault(table, {})
+            times[phase] = times.get(phase, 0.0) + seconds
+
+    def since(self, phase, start, table=None):
+        # add the time from start (time.perf_counter) and return the time now
+        now = time.perf_counter()
+        self.add(phase, now - start, table=table)
+        return now
+
+    def count(self, name, value=1):
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def built(self, SomeClass):
+        # no listener on the declarative base, the mappers of the build are
+        # only kept by a weak reference for the count of the mappers configured
+        self.mappers.add(SomeClass.__mapper__)
+
+    @property
+    def counters(self):
+        counters = dict(self.counts)
+        counters['mappers_configured'] = len([mapper for mapper in self.mappers if mapper.configured])
+        return counters
+
+    def toDict(self):
+        return {
+            'phases': dict(self.phases),
+            'tables': {name: dict(times) for name, times in self.tables.items()},
+            'counters': self.counters,
+        }
+
+    def toJson(self, **kwargs):
+        return json.dumps(self.toDict(), **kwargs)
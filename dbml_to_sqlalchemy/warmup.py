@@ -0,0 +1,108 @@
+"""
+    Warmup of the Model Class before the first query
+
+    the lazy classes are built, the mappers are configured and the statements
+    get by primary key and insert of each class are compiled in the cache of
+    the engine, the pool is disposed after: a master process (gunicorn
+    --preload) can warm the classes and the workers inherit them by fork
+"""
+import gc
+import time
+
+from sqlalchemy import and_, bindparam, insert, select
+from sqlalchemy.sql import compiler
+
+from dbml_to_sqlalchemy import mymodel
+from dbml_to_sqlalchemy.main import getLock, LazyModels
+
+
+def getRegistry(cls):
+    registry = next((base.registry for base in cls if hasattr(base, 'registry')), None)
+    if registry is None:
+        raise ValueError("no declarative registry in %r" % (cls, ))
+    return registry
+
+
+def buildLazyModels(module):
+    lazy = vars(module).get('__getattr__')
+    if not isinstance(lazy, LazyModels):
+        return 0
+    for name in lazy.tables:
+        getattr(module, name)
+    return len(lazy.tables)
+
+
+def createStatements(mapper):
+    cls = mapper.class_
+    if '__dbml_get__' not in vars(cls):
+        # parameters are the keys of the columns of the primary key
+        cls.__dbml_get__ = select(cls).where(and_(*[col == bindparam(col.key) for col in mapper.primary_key]))
+        cls.__dbml_insert__ = insert(mapper.local_table)
+    return [
+        (cls.__dbml_get__, [col.key for col in mapper.primary_key], False),
+        (cls.__dbml_insert__, [col.key for col in mapper.local_table.columns], False),
+        (cls.__dbml_insert__, [col.key for col in mapper.local_table.columns], True),
+    ]
+
+
+def compileCached(engine, statement, keys, executemany):
+    # same key as Connection.execute(statement, params), sqlalchemy has no
+    # public api for fill the cache of the compiled statements, the warmup
+    # is never fatal: a change of the private api only loses the cache
+    try:
+        if engine is not None and engine._compiled_cache is not None:
+            statement._compile_w_cache(dialect=engine.dialect, compiled_cache=engine._compiled_cache, column_keys=sorted(keys), for_executemany=executemany, schema_translate_map=None, linting=engine.dialect.compiler_linting | compiler.WARN_LINTING)
+            return
+    except (AttributeError, TypeError):
+        pass
+    statement.compile()
+
+
+def warmupModels(cls, module, engine):
+    start = time.perf_counter()
+    registry = getRegistry(cls)
+    with getLock(cls):
+        lazy = buildLazyModels(module)
+        registry.configure(cascade=True)
+        mappers = list(registry.mappers)
+        # targets of relationship(class2.__name__) are resolved by configure
+        relationships = len([rel.mapper for mapper in mappers for rel in mapper.relationships])
+    statements = 0
+    for mapper in mappers:
+        for statement, keys, executemany in createStatements(mapper):
+            compileCached(engine, statement, keys, executemany)
+            statements = statements + 1
+    return {'lazy': lazy, 'mappers': len(mappers), 'relationships': relationships, 'statements': statements, 'seconds': time.perf_counter() - start}
+
+
+def freezeObjects():
+    # objects of the master are not scanned by the gc of the workers, their
+    # pages are not copied by the refcount changes of the gc
+    gc.collect()
+    gc.freeze()
+
+
+def warmup(*cls, module=mymodel, bind=None, freeze=False):
+    if bind is not None:
+        # the dialect is initialized by the first connection (version, ...)
+        with bind.connect():
+            pass
+    stats = warmupModels(cls, module, bind)
+    if bind is not None:
+        # no connection of the pool is shared with the forked workers
+        bind.dispose()
+    if freeze:
+        freezeObjects()
+    return stats
+
+
+async def asyncWarmup(*cls, module=mymodel, bind=None, freeze=False):
+    if bind is not None:
+        async with bind.connect():
+            pass
+    stats = warmupModels(cls, module, bind.sync_engine if bind is not None else None)
+    if bind is not None:
+        await bind.dispose()
+    if freeze:
+        freezeObjects()
+    return stats
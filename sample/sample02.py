@@ -26,13 +26,9 @@ parsed = PyDBML(source)
 createModel(parsed.tables[0], db.Model)
 
 
-def model_to_dict(obj):
-    return {c.name: getattr(obj, c.name) for c in obj.__table__.columns}
-
-
 @app.route('/me')
 def mepath():
-    return model_to_dict(mymodel.User.query.filter_by(id=1).first()), 200
+    return mymodel.User.query.filter_by(id=1).first().to_dict(), 200
 
 
 if __name__ == "__main__":
@@ -42,9 +42,17 @@ setup(
     long_description_content_type='text/markdown',
     include_package_data=True,
     install_requires=REQUIRED,
+    extras_require={
+        'asyncio': ['SQLAlchemy[asyncio]>=2.0.13', 'aiosqlite'],
+        'test': ['SQLAlchemy[asyncio]>=2.0.13', 'aiosqlite', 'flask-sqlalchemy', 'flake8'],
+    },
     url=URLPKG,
     classifiers=CLASSIFIED,
-    entry_points={},
+    entry_points={
+        'console_scripts': [
+            'dbml-to-sqlalchemy = dbml_to_sqlalchemy.codegen:main',
+        ],
+    },
     zip_safe=False,
     platforms='any'
 )
@@ -5,7 +5,7 @@ import sqlalchemy.exc
 from sqlalchemy.orm import Session
 from pydbml import PyDBML
 
-from dbml_to_sqlalchemy import createModel
+from dbml_to_sqlalchemy import createModel, createModels
 
 
 class BasicTest(unittest.TestCase):
@@ -258,3 +258,66 @@ class BasicTest(unittest.TestCase):
                 user = User(idd=2, iddd=2)
                 session.add_all([user, ])
                 session.commit()
+
+    def test_enum_shared(self):
+        source = """
+        Table user {
+        id integer [primary key]
+        cola job_status
+        colb job_status
+        colc varchar(20)
+        cold varchar(20)
+        }
+
+        enum job_status {
+            created
+            running
+        }
+        """
+        parsed = PyDBML(source)
+        User = createModel(parsed.tables[0], self.Base)
+        self.assertTrue(User.cola.type.enum_class is User.colb.type.enum_class)
+        self.assertFalse(User.colc.type is User.cold.type)
+        self.assertEqual(User.cold.type.length, 20)
+
+    def test_indexes(self):
+        source = """
+        Table useri {
+        id integer [pk]
+        cola varchar
+        colb varchar
+        colc integer
+
+        indexes {
+            cola
+            (cola, colb) [name: 'ix_ab']
+            colc [type: hash]
+            (cola, colc) [unique, type: btree]
+            `lower(colb)` [name: 'ix_lower']
+            colb [type: gin]
+        }
+        }
+
+        Table posti {
+        id integer [pk]
+        userid integer [ref: > useri.id]
+        }
+        """
+        parsed = PyDBML(source)
+        User, Post = createModels(parsed, self.Base, index_fk=True)
+        indexes = {index.name: index for index in User.__table__.indexes}
+        self.assertEqual(sorted(indexes), ['ix_ab', 'ix_lower', 'ix_useri_cola', 'ix_useri_cola_colc', 'ix_useri_colb', 'ix_useri_colc'])
+        self.assertEqual([col.name for col in indexes['ix_ab'].columns], ['cola', 'colb'])
+        self.assertTrue(indexes['ix_useri_cola_colc'].unique)
+        self.assertEqual(indexes['ix_useri_colc'].dialect_kwargs['postgresql_using'], 'hash')
+        self.assertEqual(indexes['ix_useri_colc'].dialect_kwargs['mysql_using'], 'hash')
+        # gin is only known by postgresql
+        self.assertEqual(indexes['ix_useri_colb'].dialect_kwargs, {'postgresql_using': 'gin'})
+        self.assertEqual([index.name for index in Post.__table__.indexes], ['ix_posti_userid'])
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateIndex
+        self.assertEqual(str(CreateIndex(indexes['ix_lower']).compile(dialect=postgresql.dialect())), 'CREATE INDEX ix_lower ON useri (lower(colb))')
+        self.metadata.create_all(self.engine)
+        with self.engine.connect() as conn:
+            names = conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'useri'").scalars().all()
+        self.assertEqual(sorted(names), sorted(indexes))
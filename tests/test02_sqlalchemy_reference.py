@@ -5,7 +5,7 @@ import sqlalchemy.exc
 from sqlalchemy.orm import Session
 from pydbml import PyDBML
 
-from dbml_to_sqlalchemy import createModel
+from dbml_to_sqlalchemy import createModel, createModels
 
 from sqlalchemy.engine import Engine
 from sqlalchemy import event
@@ -162,3 +162,40 @@ class BasicTest(unittest.TestCase):
             session.add_all([post, ])
             session.commit()
             self.assertEqual(len(session.scalars(db.select(User)).all()[0].postds), 2)
+
+    def test_relation_lazy(self):
+        with Session(self.engine) as session:
+            source = """
+            Table userl {
+                id integer [pk]
+            }
+
+            Table postl {
+                id integer [pk]
+                userid integer
+            }
+
+            Table profilel {
+                id integer [pk]
+            }
+
+            // lazy: raise
+            Ref: postl.userid > userl.id
+
+            // lazy: write_only
+            Ref: profilel.id - userl.id
+            """
+            parsed = PyDBML(source)
+            User, Post, Profile = createModels(parsed, self.Base, lazy={'Userl.postls': 'selectin', '*': 'joined'})
+            self.assertEqual(User.postls.property.lazy, 'selectin')
+            self.assertEqual(Post.userl.property.lazy, 'raise')
+            self.assertEqual(User.profilel.property.lazy, 'joined')
+            self.assertEqual(Profile.userl.property.lazy, 'joined')
+            self.metadata.create_all(self.engine)
+            session.add_all([User(id=1), Post(id=1, userid=1), Post(id=2, userid=1)])
+            session.commit()
+            session.expunge_all()
+            user = session.scalars(db.select(User)).all()[0]
+            self.assertTrue('postls' in user.__dict__)
+            with self.assertRaises(sqlalchemy.exc.InvalidRequestError):
+                user.postls[0].userl
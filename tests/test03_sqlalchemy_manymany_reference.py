@@ -2,7 +2,7 @@ import unittest
 import sqlalchemy as db
 import sqlalchemy.sql.sqltypes
 import sqlalchemy.exc
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from pydbml import PyDBML
 
 from dbml_to_sqlalchemy import createModel
@@ -67,3 +67,53 @@ class BasicTest(unittest.TestCase):
             mypost = session.scalars(db.select(Post)).all()[0]
             self.assertEqual(mypost.postusers[0].user.id, 1)
             self.assertEqual(mypost.users[0].id, 1)
+
+    def test_secondary(self):
+        with Session(self.engine) as session:
+            source = """
+            Table userm {
+                id integer [pk, increment]
+            }
+
+            Table postm {
+                id integer [pk, increment, ref: <> userm.id]
+            }
+            """
+            parsed = PyDBML(source)
+            User = createModel(parsed.tables[0], self.Base)
+            Post = createModel(parsed.tables[1], self.Base)
+            from dbml_to_sqlalchemy.mymodel import Postmuserm
+            self.assertTrue(Post.userms.property.secondary is Postmuserm.__table__)
+            self.metadata.create_all(self.engine)
+            session.add_all([User(id=1), User(id=2), Post(id=1)])
+            session.commit()
+            session.add_all([Postmuserm(postm_id=1, userm_id=1), Postmuserm(postm_id=1, userm_id=2)])
+            session.commit()
+            session.expunge_all()
+            mypost = session.scalars(db.select(Post).options(selectinload(Post.userms))).all()[0]
+            self.assertTrue('userms' in mypost.__dict__)
+            self.assertEqual(sorted(user.id for user in mypost.userms), [1, 2])
+            self.assertEqual(session.scalars(db.select(User).where(User.id == 2)).all()[0].postms[0].id, 1)
+
+    def test_no_secondary(self):
+        with Session(self.engine) as session:
+            source = """
+            Table usern {
+                id integer [pk, increment]
+            }
+
+            Table postn {
+                id integer [pk, increment, ref: <> usern.id]
+            }
+            """
+            parsed = PyDBML(source)
+            User = createModel(parsed.tables[0], self.Base, secondary=False)
+            Post = createModel(parsed.tables[1], self.Base, secondary=False)
+            self.assertTrue(isinstance(Post.__dict__['userns'], property))
+            self.metadata.create_all(self.engine)
+            from dbml_to_sqlalchemy.mymodel import Postnusern
+            session.add_all([User(id=1), Post(id=1)])
+            session.commit()
+            session.add_all([Postnusern(postn_id=1, usern_id=1)])
+            session.commit()
+            self.assertEqual(session.scalars(db.select(Post)).all()[0].userns[0].id, 1)
@@ -0,0 +1,76 @@
+import unittest
+import sqlalchemy as db
+import sqlalchemy.exc
+from sqlalchemy.orm import Session
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createModels
+
+from sqlalchemy.engine import Engine
+from sqlalchemy import event
+
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for dbml_to_sqlalchemy
+    """
+    def setUp(self):
+        database_file = "sqlite://"
+        self.engine = db.create_engine(database_file, echo=False)
+        self.conn = self.engine.connect()
+        self.metadata = db.MetaData()
+
+        try:
+            from sqlalchemy.orm import DeclarativeBase
+
+            class Base(DeclarativeBase):
+                metadata = self.metadata
+        except Exception:
+            # for sqlalchemy 1.4
+            from sqlalchemy.orm import declarative_base
+            Base = declarative_base()
+        self.Base = Base
+
+    def test_basic(self):
+        with Session(self.engine) as session:
+            source = """
+            Table poste {
+                id integer [pk]
+                userid integer [ref: > usere.id]
+            }
+
+            Table usere {
+                id integer [pk]
+            }
+
+            Table tage {
+                id integer [pk, ref: <> poste.id]
+            }
+            """
+            parsed = PyDBML(source)
+            Post, User, Tag = createModels(parsed, self.Base)
+            self.assertEqual(["Poste", "Usere", "Tage"], [Post.__name__, User.__name__, Tag.__name__])
+            self.metadata.create_all(self.engine)
+            user = User(id=1)
+            session.add_all([user, ])
+            session.commit()
+            post = Post(id=1, userid=1)
+            session.add_all([post, ])
+            session.commit()
+            self.assertEqual(session.scalars(db.select(Post)).all()[0].usere.id, 1)
+            self.assertEqual(len(session.scalars(db.select(User)).all()[0].postes), 1)
+            from dbml_to_sqlalchemy.mymodel import Tageposte
+            session.add_all([Tag(id=1), Tageposte(tage_id=1, poste_id=1)])
+            session.commit()
+            self.assertEqual(session.scalars(db.select(Tag)).all()[0].postes[0].id, 1)
+            with self.assertRaises(sqlalchemy.exc.IntegrityError):
+                post = Post(id=2, userid=2)
+                session.add_all([post, ])
+                session.commit()
@@ -0,0 +1,111 @@
+import types
+import unittest
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createModels
+from dbml_to_sqlalchemy.codegen import generateModule
+from dbml_to_sqlalchemy.registry import createBase
+
+
+SOURCE = """
+Table userf {
+    id integer [pk, increment, note:'key of user']
+    name string [default: 'me', note:'only name']
+    cola job_statusf
+    Note: 'Stores user data'
+}
+
+Table postf {
+    id integer [pk, increment]
+    userid integer [ref: > userf.id]
+    code varchar(20) [unique]
+    indexes {
+        (userid, code) [type: hash]
+    }
+}
+
+Table tagf {
+    id integer [pk, ref: <> postf.id]
+}
+
+enum job_statusf {
+    created
+    running
+}
+"""
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for dbml_to_sqlalchemy.codegen
+    """
+    def setUp(self):
+        self.code = generateModule(PyDBML(SOURCE))
+        self.module = types.ModuleType('generated')
+        exec(compile(self.code, 'generated.py', 'exec'), vars(self.module))
+
+    def test_no_pydbml(self):
+        self.assertFalse('pydbml' in self.code)
+        self.assertFalse('dbml_to_sqlalchemy' in self.code.split('\n', 1)[1])
+
+    def test_same_model(self):
+        module = types.ModuleType('built')
+        createModels(PyDBML(SOURCE), createBase(), module=module)
+        for name in ('Userf', 'Postf', 'Tagf', 'Tagfpostf'):
+            built = getattr(module, name)
+            generated = getattr(self.module, name)
+            self.assertEqual(built.__doc__, generated.__doc__)
+            self.assertEqual(built.__tablename__, generated.__tablename__)
+            self.assertEqual(sorted(repr(index) for index in built.__table__.indexes), sorted(repr(index) for index in generated.__table__.indexes))
+            self.assertEqual([(col.name, repr(col.type), col.primary_key, col.nullable) for col in built.__table__.columns],
+                             [(col.name, repr(col.type), col.primary_key, col.nullable) for col in generated.__table__.columns])
+        self.assertEqual([item.name for item in self.module.job_statusf], ['created', 'running'])
+
+    def test_create_insert(self):
+        engine = db.create_engine("sqlite://", echo=False)
+        self.module.Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add_all([self.module.Userf(id=1, cola='running'), self.module.Tagf(id=1)])
+            session.commit()
+            session.add_all([self.module.Postf(id=1, userid=1), self.module.Tagfpostf(tagf_id=1, postf_id=1)])
+            session.commit()
+            post = session.scalars(db.select(self.module.Postf)).all()[0]
+            self.assertEqual(post.userf.name, 'me')
+            self.assertEqual(post.userf.cola.name, 'running')
+            self.assertEqual(post.tagfs[0].id, 1)
+
+    def test_identifier(self):
+        # dbml names which are not python identifiers
+        code = generateModule(PyDBML('Table oddf {\n  id integer [pk]\n  "Full Name" varchar\n  class integer\n  "1st" integer\n}'))
+        module = types.ModuleType('generated')
+        exec(compile(code, 'generated.py', 'exec'), vars(module))
+        Oddf = module.Oddf
+        self.assertEqual([col.name for col in Oddf.__table__.columns], ['id', 'full_name', 'class', '1st'])
+        self.assertEqual([Oddf.full_name.key, Oddf.class_.key, Oddf._1st.key], ['full_name', 'class_', '_1st'])
+        engine = db.create_engine("sqlite://", echo=False)
+        module.Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(Oddf(id=1, full_name='bob', class_=2, _1st=3))
+            session.commit()
+            self.assertEqual(session.get(Oddf, 1).class_, 2)
+            self.assertEqual(session.get(Oddf, 1).to_dict(), {'id': 1, 'full_name': 'bob', 'class_': 2, '_1st': 3})
+
+    def test_serializers(self):
+        engine = db.create_engine("sqlite://", echo=False)
+        self.module.Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(self.module.Userf.from_dict({'id': 1, 'name': 'bob', 'cola': 'created', 'other': 'ignored'}))
+            session.add(self.module.Postf(id=1, userid=1, code='a'))
+            session.commit()
+            user = session.get(self.module.Userf, 1)
+            self.assertEqual(user.to_dict(), {'id': 1, 'name': 'bob', 'cola': self.module.job_statusf.created})
+            self.assertEqual(user.to_dict(depth=1)['postfs'], [{'id': 1, 'userid': 1, 'code': 'a'}])
+            Postf = self.module.Postf
+            self.assertEqual(Postf.to_dicts(session.execute(db.select(Postf.__table__)).all()), [{'id': 1, 'userid': 1, 'code': 'a'}])
+        # same serializers as the classes of createModels
+        module = types.ModuleType('built')
+        createModels(PyDBML(SOURCE), createBase(), module=module)
+        for name in ('Userf', 'Postf', 'Tagf', 'Tagfpostf'):
+            self.assertEqual(getattr(module, name).__dbml_columns__, getattr(self.module, name).__dbml_columns__)
@@ -0,0 +1,133 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+import sqlalchemy as db
+from sqlalchemy.orm import Session, DeclarativeBase
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createModels
+from dbml_to_sqlalchemy import loader
+
+
+SOURCE = """
+Table userg {
+    id integer [pk, increment, note:'key of user']
+    name varchar(20) [default: 'me', not null]
+    cola job_statusg
+    indexes {
+        `lower(name)`
+    }
+    Note: 'Stores user data'
+}
+
+Table postg {
+    id integer [pk, increment]
+    userid integer // id of the user
+    rank integer [default: 2]
+    indexes {
+        (userid, rank) [unique, name: 'post_rank']
+    }
+}
+
+// lazy: selectin
+Ref post_user: postg.userid > userg.id [delete: cascade]
+
+enum job_statusg {
+    created [note: 'Waiting to be processed']
+    running
+}
+"""
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for dbml_to_sqlalchemy.loader
+    """
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'schema.dbml')
+        with open(self.path, 'w') as f:
+            f.write(SOURCE)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_dump_load(self):
+        data = loader.dumpDatabase(PyDBML(SOURCE))
+        self.assertEqual(loader.dumpDatabase(loader.loadDatabase(data)), data)
+
+    def test_cache(self):
+        loader.loadDbml(self.path)
+        self.assertEqual(len(os.listdir(os.path.join(self.tmp, '__pycache__'))), 1)
+        with mock.patch.object(loader, 'PyDBML', side_effect=AssertionError('parsed')):
+            database = loader.loadDbml(self.path)
+        try:
+            from sqlalchemy.orm import DeclarativeBase
+
+            class Base(DeclarativeBase):
+                pass
+        except Exception:
+            # for sqlalchemy 1.4
+            from sqlalchemy.orm import declarative_base
+            Base = declarative_base()
+        User, Post = createModels(database, Base)
+        engine = db.create_engine("sqlite://", echo=False)
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add_all([User(id=1, cola='running'), Post(id=1, userid=1)])
+            session.commit()
+            self.assertEqual(session.scalars(db.select(Post)).all()[0].userg.name, 'me')
+
+    def test_comment(self):
+        # the comments of the refs (lazy: ...) and of the columns are kept by the cache
+        for i in range(2):
+            database = loader.loadDbml(self.path)
+            self.assertEqual(database.refs[0].comment, 'lazy: selectin')
+            self.assertEqual(database.tables[1]['userid'].comment, 'id of the user')
+            Base = type('Base', (DeclarativeBase, ), {})
+            User, Post = createModels(database, Base)
+            self.assertEqual(Post.userg.property.lazy, 'selectin')
+            Base.registry.dispose()
+        # a cache of an other format is not used
+        with mock.patch.object(loader, 'CACHE_FORMAT', 1):
+            loader.loadDbml(self.path)
+        self.assertEqual(len(os.listdir(os.path.join(self.tmp, '__pycache__'))), 1)
+
+    def test_invalidate(self):
+        loader.loadDbml(self.path)
+        with open(self.path, 'a') as f:
+            f.write('\nTable tagg {\n  id integer [pk]\n}\n')
+        with mock.patch.object(loader, '__version__', 'new'):
+            database = loader.loadDbml(self.path)
+        self.assertEqual(len(database.tables), 3)
+        self.assertEqual(len(os.listdir(os.path.join(self.tmp, '__pycache__'))), 1)
+        with mock.patch.object(loader, 'PyDBML', side_effect=AssertionError('parsed')):
+            with self.assertRaises(AssertionError):
+                loader.loadDbml(self.path)
+
+    def test_sibling(self):
+        # the cache of schema.dbml.bak is not an old cache of schema.dbml
+        shutil.copy(self.path, self.path + '.bak')
+        loader.loadDbml(self.path + '.bak')
+        loader.loadDbml(self.path)
+        with open(self.path, 'a') as f:
+            f.write('\nTable tagg {\n  id integer [pk]\n}\n')
+        loader.loadDbml(self.path)
+        names = os.listdir(os.path.join(self.tmp, '__pycache__'))
+        self.assertEqual(len(names), 2)
+        self.assertEqual(len([name for name in names if name.startswith('schema.dbml.bak.')]), 1)
+
+    def test_files(self):
+        # the enum and the table of the ref are in the other file
+        paths = [os.path.join(self.tmp, 'user.dbml'), os.path.join(self.tmp, 'post.dbml')]
+        with open(paths[0], 'w') as f:
+            f.write(SOURCE[:SOURCE.index('Table postg')] + SOURCE[SOURCE.index('enum job_statusg'):])
+        with open(paths[1], 'w') as f:
+            f.write(SOURCE[SOURCE.index('Table postg'):SOURCE.index('enum job_statusg')])
+        expected = loader.dumpDatabase(PyDBML(SOURCE))
+        for processes in (1, 2):
+            database = loader.loadDbmlFiles(paths, processes=processes)
+            self.assertEqual(loader.dumpDatabase(database), expected)
+            self.assertIs(database.tables[0].columns[2].type, database.enums[0])
@@ -0,0 +1,76 @@
+import csv
+import io
+import unittest
+import sqlalchemy as db
+import sqlalchemy.exc
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createModels
+from dbml_to_sqlalchemy.bulk import bulkInsert, bulkLoad
+
+from sqlalchemy.engine import Engine
+from sqlalchemy import event
+
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragma(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for dbml_to_sqlalchemy.bulk
+    """
+    def setUp(self):
+        database_file = "sqlite://"
+        self.engine = db.create_engine(database_file, echo=False)
+        self.metadata = db.MetaData()
+
+        try:
+            from sqlalchemy.orm import DeclarativeBase
+
+            class Base(DeclarativeBase):
+                metadata = self.metadata
+        except Exception:
+            # for sqlalchemy 1.4
+            from sqlalchemy.orm import declarative_base
+            Base = declarative_base()
+        source = """
+        Table userk {
+            id integer [pk]
+            name varchar
+        }
+
+        Table postk {
+            id integer [pk]
+            userid integer [ref: > userk.id]
+        }
+        """
+        self.User, self.Post = createModels(PyDBML(source), Base)
+        self.metadata.create_all(self.engine)
+
+    def count(self, model):
+        with self.engine.connect() as conn:
+            return conn.execute(db.select(db.func.count()).select_from(model.__table__)).scalar()
+
+    def test_insert(self):
+        stats = bulkInsert(self.engine, self.User, ({'id': i, 'name': 'user%s' % i} for i in range(2500)), batch=1000)
+        self.assertEqual(stats['rows'], 2500)
+        self.assertEqual(stats['table'], 'userk')
+        self.assertTrue(stats['rows_per_second'] > 0)
+        bulkInsert(self.engine, self.User, [(i, 'user%s' % i) for i in range(2500, 2600)])
+        rows = csv.reader(io.StringIO("name,id\nusera,3000\nuserb,3001\n"))
+        bulkInsert(self.engine, self.User, rows, columns=next(rows))
+        self.assertEqual(self.count(self.User), 2602)
+        with self.engine.connect() as conn:
+            self.assertEqual(conn.execute(db.select(self.User.name).where(self.User.id == 3001)).scalar(), 'userb')
+
+    def test_load_order(self):
+        stats = bulkLoad(self.engine, {self.Post: [(i, i % 10) for i in range(100)], self.User: [(i, None) for i in range(10)]})
+        self.assertEqual([stat['table'] for stat in stats], ['userk', 'postk'])
+        self.assertEqual(self.count(self.Post), 100)
+        with self.assertRaises(sqlalchemy.exc.IntegrityError):
+            bulkLoad(self.engine, {self.Post: [(1000, 1000)]})
+        self.assertEqual(self.count(self.Post), 100)
@@ -0,0 +1,76 @@
+import types
+import unittest
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createLazyModels
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for dbml_to_sqlalchemy lazy models
+    """
+    def setUp(self):
+        database_file = "sqlite://"
+        self.engine = db.create_engine(database_file, echo=False)
+        self.metadata = db.MetaData()
+
+        try:
+            from sqlalchemy.orm import DeclarativeBase
+
+            class Base(DeclarativeBase):
+                metadata = self.metadata
+        except Exception:
+            # for sqlalchemy 1.4
+            from sqlalchemy.orm import declarative_base
+            Base = declarative_base()
+        self.Base = Base
+        self.module = types.ModuleType('lazymodel')
+
+    def test_lazy(self):
+        source = """
+        Table customerh {
+            id integer [pk]
+            addressid integer [ref: > addressh.id]
+        }
+
+        Table invoiceh {
+            id integer [pk]
+            customerid integer [ref: > customerh.id]
+        }
+
+        Table addressh {
+            id integer [pk]
+            status statush
+        }
+
+        Table tagh {
+            id integer [pk]
+        }
+
+        enum statush {
+            old
+            new
+        }
+        """
+        createLazyModels(PyDBML(source), self.Base, module=self.module)
+        self.assertEqual(len(self.metadata.tables), 0)
+        Invoice = self.module.Invoiceh
+        self.assertEqual(sorted(self.metadata.tables), ['customerh', 'invoiceh'])
+        self.assertTrue('Invoiceh' in vars(self.module))
+        self.assertFalse('Customerh' in vars(self.module))
+        with self.assertRaises(AttributeError):
+            self.module.Unknown
+        Customer = self.module.Customerh
+        self.assertEqual(sorted(self.metadata.tables), ['addressh', 'customerh', 'invoiceh'])
+        self.assertTrue('Addressh' in vars(self.module))
+        self.assertTrue('statush' in vars(self.module))
+        self.assertFalse('tagh' in self.metadata.tables)
+        self.metadata.create_all(self.engine)
+        with Session(self.engine) as session:
+            session.add_all([self.module.Addressh(id=1, status='new'), Customer(id=1, addressid=1), Invoice(id=1, customerid=1)])
+            session.commit()
+            invoice = session.scalars(db.select(Invoice)).all()[0]
+            self.assertEqual(invoice.customerh.addressh.status.name, 'new')
+            self.assertEqual(invoice.customerh.addressh.customerhs[0].invoicehs[0].id, 1)
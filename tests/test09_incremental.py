@@ -0,0 +1,176 @@
+import os
+import tempfile
+import types
+import unittest
+import warnings
+from unittest import mock
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createModels
+from dbml_to_sqlalchemy.incremental import updateModels
+from dbml_to_sqlalchemy.loader import loadDbml
+
+
+SOURCE = """
+Table userj {
+    id integer [pk]
+    name varchar
+}
+
+Table postj {
+    id integer [pk]
+    userid integer [ref: > userj.id]
+}
+
+Table logj {
+    id integer [pk]
+    message varchar
+}
+"""
+
+CHAIN = """
+Table chaina {
+    id integer [pk]
+}
+
+Table chainb {
+    id integer [pk]
+    aid integer [ref: > chaina.id]
+}
+
+Table chainc {
+    id integer [pk]
+    bid integer [ref: > chainb.id]
+}
+
+Table chaind {
+    id integer [pk]
+    cid integer [ref: - chainc.id]
+    name varchar
+}
+
+Table chaine {
+    id integer [pk]
+    did integer [ref: > chaind.id]
+}
+
+Table chainf {
+    id integer [pk, ref: <> chainb.id]
+}
+"""
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for dbml_to_sqlalchemy.incremental
+    """
+    def setUp(self):
+        self.metadata = db.MetaData()
+
+        try:
+            from sqlalchemy.orm import DeclarativeBase
+
+            class Base(DeclarativeBase):
+                metadata = self.metadata
+        except Exception:
+            # for sqlalchemy 1.4
+            from sqlalchemy.orm import declarative_base
+            Base = declarative_base()
+        self.Base = Base
+        self.module = types.ModuleType('incremental')
+
+    def check(self):
+        engine = db.create_engine("sqlite://", echo=False)
+        self.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add_all([self.module.Userj(id=1, name='me'), self.module.Postj(id=1, userid=1)])
+            session.commit()
+            return session.scalars(db.select(self.module.Postj)).all()[0].userj
+
+    def test_update(self):
+        report = updateModels(PyDBML(SOURCE), self.Base, module=self.module)
+        self.assertEqual(report['added'], ['userj', 'postj', 'logj'])
+        self.assertEqual(report['rebuilt'], ['userj', 'postj', 'logj'])
+        self.assertEqual(self.check().name, 'me')
+        User, Log = self.module.Userj, self.module.Logj
+        report = updateModels(PyDBML(SOURCE.replace("message varchar", "message text\n    level integer")), self.Base, module=self.module)
+        self.assertEqual(report['changed'], ['logj'])
+        self.assertEqual(report['rebuilt'], ['logj'])
+        self.assertEqual(report['columns']['logj'], {'added': ['level'], 'removed': [], 'changed': ['message']})
+        self.assertTrue(self.module.Userj is User)
+        self.assertFalse(self.module.Logj is Log)
+        self.assertTrue('level' in self.metadata.tables['logj'].c)
+        report = updateModels(PyDBML(SOURCE.replace("name varchar", "name varchar(20)").replace("Table logj", "Table logk")), self.Base, module=self.module)
+        self.assertEqual(report['added'], ['logk'])
+        self.assertEqual(report['removed'], ['logj'])
+        self.assertEqual(report['changed'], ['userj'])
+        self.assertEqual(sorted(report['rebuilt']), ['logk', 'postj', 'userj'])
+        self.assertFalse(self.module.Userj is User)
+        self.assertFalse(hasattr(self.module, 'Logj'))
+        self.assertEqual(sorted(self.metadata.tables), ['logk', 'postj', 'userj'])
+        self.assertEqual(self.check().name, 'me')
+
+    def test_from_models(self):
+        createModels(PyDBML(SOURCE), self.Base, module=self.module)
+        report = updateModels(PyDBML(SOURCE), self.Base, module=self.module)
+        self.assertEqual(report['added'], ['userj', 'postj', 'logj'])
+        self.assertEqual(self.check().name, 'me')
+        self.assertEqual(updateModels(PyDBML(SOURCE), self.Base, module=self.module)['rebuilt'], [])
+
+    def test_cache(self):
+        # a parse and a load from the cache of the same file have the same fingerprints
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'schema.dbml')
+            with open(path, 'w') as f:
+                f.write(SOURCE.replace("userid integer [ref: > userj.id]", "userid integer [ref: > userj.id] // lazy: selectin"))
+            report = updateModels(loadDbml(path), self.Base, module=self.module)
+            self.assertEqual(report['rebuilt'], ['userj', 'postj', 'logj'])
+            with mock.patch('dbml_to_sqlalchemy.loader.PyDBML', side_effect=AssertionError('parsed')):
+                report = updateModels(loadDbml(path), self.Base, module=self.module)
+            self.assertEqual(report['changed'], [])
+            self.assertEqual(report['rebuilt'], [])
+            self.assertEqual(self.module.Postj.userj.property.lazy, 'selectin')
+
+    def checkChain(self):
+        engine = db.create_engine("sqlite://", echo=False)
+        self.metadata.create_all(engine)
+        module = self.module
+        with Session(engine) as session:
+            session.add_all([module.Chaina(id=1), module.Chainb(id=1, aid=1), module.Chainc(id=1, bid=1), module.Chaind(id=1, cid=1), module.Chaine(id=1, did=1), module.Chainf(id=1)])
+            session.commit()
+            session.add(module.Chainfchainb(chainf_id=1, chainb_id=1))
+            session.commit()
+            chainb = session.get(module.Chainb, 1)
+            self.assertEqual(chainb.chaincs[0].chaind.chaines[0].id, 1)
+            self.assertEqual(session.get(module.Chaine, 1).chaind.chainc.chainb.chaina.chainbs, [chainb])
+            self.assertEqual([chainf.id for chainf in chainb.chainfs], [1])
+
+    def test_neighbours(self):
+        # only the direct neighbours of a changed table are rebuilt, the
+        # classes linked to them are kept with new relationships
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', db.exc.SAWarning)
+            updateModels(PyDBML(CHAIN), self.Base, module=self.module)
+            Chaina, Chainb = self.module.Chaina, self.module.Chainb
+            report = updateModels(PyDBML(CHAIN.replace("name varchar", "name text")), self.Base, module=self.module)
+            self.assertEqual(report['changed'], ['chaind'])
+            self.assertEqual(report['rebuilt'], ['chainc', 'chaind', 'chaine'])
+            self.assertTrue(self.module.Chaina is Chaina)
+            self.assertTrue(self.module.Chainb is Chainb)
+            self.checkChain()
+            Chaind = self.module.Chaind
+            source = CHAIN.replace("name varchar", "name text").replace("aid integer", "aid bigint")
+            report = updateModels(PyDBML(source), self.Base, module=self.module)
+            self.assertEqual(report['rebuilt'], ['chaina', 'chainb', 'chainc', 'chainf'])
+            self.assertFalse(self.module.Chainb is Chainb)
+            self.assertTrue(self.module.Chaind is Chaind)
+            report = updateModels(PyDBML(source.replace("Table chainf {\n    id integer", "Table chainf {\n    id bigint")), self.Base, module=self.module)
+            self.assertEqual(report['rebuilt'], ['chainb', 'chainf'])
+            self.checkChain()
+            Chainf = self.module.Chainf
+            report = updateModels(PyDBML(source.replace("Table chaina {\n    id integer [pk]", "Table chaina {\n    id integer [pk]\n    code varchar").replace("Table chainf {\n    id integer", "Table chainf {\n    id bigint")), self.Base, module=self.module)
+            self.assertEqual(report['rebuilt'], ['chaina', 'chainb'])
+            self.assertTrue(self.module.Chainf is Chainf)
+            self.checkChain()
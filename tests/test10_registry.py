@@ -0,0 +1,75 @@
+import gc
+import unittest
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import mymodel
+from dbml_to_sqlalchemy import Registry
+
+
+SOURCE = """
+Table userr {
+    id integer [pk]
+    status statusr
+}
+
+Table postr {
+    id integer [pk]
+    userid integer [ref: > userr.id]
+}
+
+Table tagr {
+    id integer [pk, ref: <> postr.id]
+}
+
+enum statusr {
+    old
+    new
+}
+"""
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for dbml_to_sqlalchemy.registry
+    """
+    def check(self, registry):
+        engine = db.create_engine("sqlite://", echo=False)
+        registry.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add_all([registry.Userr(id=1, status='new'), registry.Postr(id=1, userid=1)])
+            session.commit()
+            return session.scalars(db.select(registry.Postr)).all()[0].userr.status.name
+
+    def test_isolated(self):
+        first, second = Registry(), Registry()
+        first.createModels(PyDBML(SOURCE))
+        second.createModels(PyDBML(SOURCE.replace("new\n", "new\n    other\n")))
+        self.assertFalse(first.Userr is second.Userr)
+        self.assertFalse(first.statusr is second.statusr)
+        self.assertFalse(first.metadata is second.metadata)
+        self.assertFalse(hasattr(mymodel, 'Userr'))
+        self.assertEqual(self.check(first), 'new')
+        self.assertEqual(self.check(second), 'new')
+
+    def test_dispose(self):
+        with Registry() as registry:
+            registry.createModels(PyDBML(SOURCE))
+            ref = weakref.ref(registry.Userr)
+            self.assertEqual(self.check(registry), 'new')
+        self.assertEqual(len(registry.metadata.tables), 0)
+        with self.assertRaises(AttributeError):
+            registry.Userr
+        gc.collect()
+        self.assertTrue(ref() is None)
+
+    def test_threads(self):
+        def build(i):
+            registry = Registry()
+            registry.createModels(PyDBML(SOURCE))
+            return self.check(registry)
+        with ThreadPoolExecutor(4) as pool:
+            self.assertEqual(list(pool.map(build, range(8))), ['new'] * 8)
@@ -0,0 +1,86 @@
+import threading
+import types
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createModels, createLazyModels
+
+try:
+    from sqlalchemy.orm import DeclarativeBase
+
+    class Base(DeclarativeBase):
+        pass
+except Exception:
+    # for sqlalchemy 1.4
+    from sqlalchemy.orm import declarative_base
+    Base = declarative_base()
+
+
+SOURCE = """
+Table usert%(n)s {
+    id integer [pk]
+    name varchar
+}
+
+Table postt%(n)s {
+    id integer [pk]
+    userid integer [ref: > usert%(n)s.id]
+}
+
+Table tagt%(n)s {
+    id integer [pk, ref: <> postt%(n)s.id]
+}
+"""
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for concurrent construction of Model Class
+    """
+    def test_threads(self):
+        module = types.ModuleType('threads')
+        seen = []
+        stop = threading.Event()
+
+        def reader():
+            # a class published has all its relationships
+            while not stop.is_set():
+                for name, obj in list(vars(module).items()):
+                    if name.startswith('Usert'):
+                        seen.append(hasattr(obj, 'postt%ss' % name[5:]))
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda n: createModels(PyDBML(SOURCE % {'n': n}), Base, module=module), range(32)))
+        stop.set()
+        thread.join()
+        self.assertTrue(all(seen))
+        for n, classes in enumerate(results):
+            self.assertEqual([cls.__name__ for cls in classes], ['Usert%s' % n, 'Postt%s' % n, 'Tagt%s' % n])
+            self.assertIs(getattr(module, 'Usert%s' % n), classes[0])
+            self.assertIn("tagt%s_postt%s" % (n, n), Base.metadata.tables)
+        Base.registry.configure()
+        engine = db.create_engine("sqlite://", echo=False)
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            user = module.Usert7(id=1, name='bob')
+            session.add(user)
+            session.add(module.Postt7(id=1, userid=1))
+            session.commit()
+            self.assertEqual(len(user.postt7s), 1)
+
+    def test_lazy_threads(self):
+        module = types.ModuleType('lazythreads')
+        createLazyModels(PyDBML(SOURCE % {'n': 'l'}), Base, module=module)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            classes = list(pool.map(lambda name: getattr(module, name), ['Usertl', 'Posttl', 'Tagtl'] * 8))
+        self.assertEqual(len(set(classes)), 3)
+        self.assertIs(module.Usertl.posttls.property.mapper.class_, module.Posttl)
+
+
+if __name__ == '__main__':
+    unittest.main()
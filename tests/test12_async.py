@@ -0,0 +1,111 @@
+import unittest
+from pydbml import PyDBML
+
+try:
+    import aiosqlite
+    from sqlalchemy import select, event
+    from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+    from dbml_to_sqlalchemy.aio import AsyncRegistry, getAsyncLazy
+except ImportError:
+    AsyncRegistry = None
+
+
+SOURCE = """
+Table usera {
+    id integer [pk]
+    name varchar
+}
+
+Table posta {
+    id integer [pk]
+    userid integer [ref: > usera.id]
+}
+
+Table taga {
+    id integer [pk, ref: <> posta.id]
+}
+"""
+
+
+@unittest.skipIf(AsyncRegistry is None, "needs sqlalchemy[asyncio] and aiosqlite")
+class BasicTest(unittest.IsolatedAsyncioTestCase):
+    """
+        Class for Basic Unitaire Test for dbml_to_sqlalchemy.aio
+    """
+    async def asyncSetUp(self):
+        self.engine = create_async_engine("sqlite+aiosqlite://", echo=False)
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+
+    def test_lazy(self):
+        self.assertEqual(getAsyncLazy(None), {'*': 'raise_on_sql'})
+        self.assertEqual(getAsyncLazy('raise'), {'*': 'raise'})
+        self.assertEqual(getAsyncLazy({'Usera.postas': 'joined'}), {'Usera.postas': 'joined', '*': 'raise_on_sql'})
+        with self.assertRaises(ValueError):
+            getAsyncLazy('select')
+        with self.assertRaises(ValueError):
+            getAsyncLazy({'Usera.postas': 'dynamic'})
+
+    def test_comment(self):
+        # the strategy of a comment of a ref is checked too
+        with AsyncRegistry() as registry:
+            with self.assertRaises(ValueError):
+                registry.createModels(PyDBML(SOURCE.replace("userid integer [ref: > usera.id]", "userid integer [ref: > usera.id] // lazy: select")))
+        with AsyncRegistry() as registry:
+            registry.createModels(PyDBML(SOURCE.replace("userid integer [ref: > usera.id]", "userid integer [ref: > usera.id] // lazy: selectin")))
+            self.assertEqual(registry.Usera.postas.property.lazy, 'selectin')
+            self.assertEqual(registry.Posta.usera.property.lazy, 'selectin')
+            self.assertEqual(registry.Taga.postas.property.lazy, 'raise_on_sql')
+
+    async def test_session(self):
+        with AsyncRegistry() as registry:
+            registry.createModels(PyDBML(SOURCE), lazy={'Usera.postas': 'selectin', 'Taga.postas': 'selectin'})
+            await registry.createAll(self.engine)
+            async with AsyncSession(self.engine, expire_on_commit=False) as session:
+                session.add(registry.Usera(id=1, name='bob'))
+                session.add_all([registry.Posta(id=1, userid=1), registry.Posta(id=2, userid=1)])
+                session.add(registry.Taga(id=1))
+                session.add(registry.Tagaposta(taga_id=1, posta_id=2))
+                await session.commit()
+            async with AsyncSession(self.engine) as session:
+                user = (await session.execute(select(registry.Usera))).scalar_one()
+                # loaded by selectin, no io on access
+                self.assertEqual(sorted(post.id for post in user.postas), [1, 2])
+                queries = []
+                event.listen(self.engine.sync_engine, 'before_cursor_execute', lambda *args: queries.append(1))
+                tag = (await session.execute(select(registry.Taga))).scalar_one()
+                self.assertEqual([post.id for post in tag.postas], [2])
+                # only the tags and their posts, the other relationships are not loaded
+                self.assertEqual(len(queries), 2)
+                with self.assertRaises(Exception):
+                    tag.tagapostas
+                self.assertEqual((await user.awaitable_attrs.name), 'bob')
+            await registry.dropAll(self.engine)
+
+    async def test_raise(self):
+        with AsyncRegistry() as registry:
+            registry.createModels(PyDBML(SOURCE), lazy='raise')
+            await registry.createAll(self.engine)
+            async with AsyncSession(self.engine) as session:
+                session.add(registry.Usera(id=1, name='bob'))
+                await session.commit()
+            async with AsyncSession(self.engine) as session:
+                user = (await session.execute(select(registry.Usera))).scalar_one()
+                with self.assertRaises(Exception):
+                    user.postas
+
+    async def test_warmup(self):
+        with AsyncRegistry() as registry:
+            registry.createLazyModels(PyDBML(SOURCE))
+            stats = await registry.warmup(self.engine)
+            self.assertEqual((stats['lazy'], stats['mappers']), (3, 4))
+            self.assertTrue(registry.Usera.__mapper__.configured)
+            await registry.createAll(self.engine)
+            async with AsyncSession(self.engine) as session:
+                result = await session.execute(registry.Usera.__dbml_get__, {'id': 1})
+                self.assertIsNone(result.scalar_one_or_none())
+
+
+if __name__ == '__main__':
+    unittest.main()
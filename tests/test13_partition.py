@@ -0,0 +1,97 @@
+import types
+import unittest
+import sqlalchemy as db
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import Registry
+from dbml_to_sqlalchemy.codegen import generateModule
+from dbml_to_sqlalchemy.partition import createPartitions, getShard, shardChooser
+
+
+SOURCE = """
+Table eventp {
+    id integer [pk]
+    created date [pk]
+    Note: '''events of the users
+partition_by: RANGE (created)
+shard: eu'''
+}
+
+Table logp {
+    id integer [pk]
+    kind varchar
+    eventid integer
+    partition_by: 'LIST (kind)'
+}
+
+Table userp {
+    id integer [pk]
+    partition_by: 'HASH (id)'
+}
+"""
+
+
+def compilePg(elt):
+    return str(elt.compile(dialect=postgresql.dialect()))
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for dbml_to_sqlalchemy.partition
+    """
+    def setUp(self):
+        self.registry = Registry()
+        self.registry.createModels(PyDBML(SOURCE, allow_properties=True))
+
+    def tearDown(self):
+        self.registry.dispose()
+
+    def test_partition_by(self):
+        self.assertIn('PARTITION BY RANGE (created)', compilePg(CreateTable(self.registry.Eventp.__table__)))
+        self.assertIn('PARTITION BY LIST (kind)', compilePg(CreateTable(self.registry.Logp.__table__)))
+        self.assertIn('PARTITION BY HASH (id)', compilePg(CreateTable(self.registry.Userp.__table__)))
+
+    def test_shard(self):
+        self.assertEqual(getShard(self.registry.Eventp), 'eu')
+        self.assertEqual(self.registry.Eventp.__bind_key__, 'eu')
+        self.assertEqual(shardChooser(db.inspect(self.registry.Eventp), None), 'eu')
+        self.assertIsNone(getShard(self.registry.Logp))
+
+    def test_partitions(self):
+        ddls = createPartitions(self.registry.Eventp, {'eventp_old': ('MINVALUE', '2024-01-01'), 'eventp_2024': ('2024-01-01', '2025-01-01'), 'eventp_other': 'default'})
+        self.assertEqual([compilePg(ddl) for ddl in ddls], [
+            "CREATE TABLE eventp_old PARTITION OF eventp FOR VALUES FROM (MINVALUE) TO ('2024-01-01')",
+            "CREATE TABLE eventp_2024 PARTITION OF eventp FOR VALUES FROM ('2024-01-01') TO ('2025-01-01')",
+            "CREATE TABLE eventp_other PARTITION OF eventp DEFAULT",
+        ])
+        ddls = createPartitions(self.registry.Logp, {'logp_error': ['error', "o'clock"]}, attach=False)
+        self.assertEqual(compilePg(ddls[0]), "CREATE TABLE logp_error PARTITION OF logp FOR VALUES IN ('error', 'o''clock')")
+        ddls = createPartitions(self.registry.Userp, {'userp_%s' % i: (2, i) for i in range(2)}, attach=False)
+        self.assertEqual(compilePg(ddls[1]), "CREATE TABLE userp_1 PARTITION OF userp FOR VALUES WITH (MODULUS 2, REMAINDER 1)")
+
+    def test_no_partition(self):
+        registry = Registry()
+        registry.createModels(PyDBML("Table nop {\n    id integer [pk]\n}"))
+        with self.assertRaises(ValueError):
+            createPartitions(registry.Nop, {'nop_1': 'default'})
+        registry.dispose()
+
+    def test_other_dialect(self):
+        # partitions are only created by postgresql
+        createPartitions(self.registry.Eventp, {'eventp_2024': ('2024-01-01', '2025-01-01')})
+        engine = db.create_engine("sqlite://", echo=False)
+        self.registry.metadata.create_all(engine)
+        self.assertEqual(sorted(db.inspect(engine).get_table_names()), ['eventp', 'logp', 'userp'])
+
+    def test_codegen(self):
+        module = types.ModuleType('generated')
+        exec(compile(generateModule(PyDBML(SOURCE, allow_properties=True)), 'generated.py', 'exec'), vars(module))
+        self.assertEqual(module.Eventp.__table__.dialect_options['postgresql']['partition_by'], 'RANGE (created)')
+        self.assertEqual(module.Eventp.__bind_key__, 'eu')
+        self.assertEqual(module.Eventp.__table__.info['shard'], 'eu')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import types
+import unittest
+import sqlalchemy as db
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createTable, createTables
+
+
+SOURCE = """
+Table userc {
+    id integer [pk, increment]
+    name varchar(100) [not null, unique]
+    status statusc [default: 'new']
+}
+
+Table postc {
+    id integer [pk]
+    userid integer [ref: > userc.id]
+    title varchar
+    indexes {
+        (userid, title) [name: 'ix_post_title']
+    }
+}
+
+Table tagc {
+    id integer [pk, ref: <> postc.id]
+}
+
+enum statusc {
+    old
+    new
+}
+"""
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for createTable and createTables
+    """
+    def test_tables(self):
+        metadata = db.MetaData()
+        module = types.ModuleType('core')
+        tables = createTables(PyDBML(SOURCE), metadata, module=module)
+        self.assertEqual([table.name for table in tables], ['userc', 'postc', 'tagc'])
+        self.assertEqual(sorted(metadata.tables), ['postc', 'tagc', 'tagc_postc', 'userc'])
+        self.assertEqual([fk.target_fullname for fk in metadata.tables['postc'].foreign_keys], ['userc.id'])
+        self.assertEqual(sorted(fk.target_fullname for fk in metadata.tables['tagc_postc'].foreign_keys), ['postc.id', 'tagc.id'])
+        self.assertEqual([index.name for index in metadata.tables['postc'].indexes], ['ix_post_title'])
+        self.assertIs(metadata.tables['userc'].c.status.type.enum_class, module.statusc)
+        engine = db.create_engine("sqlite://", echo=False)
+        metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(metadata.tables['userc'].insert(), [{'name': 'bob'}])
+            connection.execute(metadata.tables['postc'].insert(), [{'id': 1, 'userid': 1, 'title': 'first'}])
+            row = connection.execute(db.select(metadata.tables['userc'])).one()
+            self.assertEqual((row.id, row.name, row.status), (1, 'bob', module.statusc.new))
+
+    def test_table(self):
+        metadata = db.MetaData()
+        parsed = PyDBML(SOURCE)
+        createTable(parsed.tables[1], metadata)
+        self.assertEqual(len(metadata.tables['postc'].foreign_keys), 0)
+        createTable(parsed.tables[0], metadata)
+        self.assertEqual([fk.target_fullname for fk in metadata.tables['postc'].foreign_keys], ['userc.id'])
+
+    def test_no_orm(self):
+        module = types.ModuleType('core')
+        createTables(PyDBML(SOURCE), db.MetaData(), module=module)
+        # only the enums are saved in the module
+        self.assertEqual([name for name in vars(module) if not name.startswith('__')], ['statusc'])
+
+
+if __name__ == '__main__':
+    unittest.main()
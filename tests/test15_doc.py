@@ -0,0 +1,64 @@
+import unittest
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import Registry
+from dbml_to_sqlalchemy.main import ClassDoc, lazyDoc
+
+
+SOURCE = """
+Table userd {
+    id integer [pk, increment]
+    name varchar(100) [not null, note: 'name of the user']
+    status statusd [default: 'new']
+    Note: 'users of the application'
+}
+
+Table postd {
+    id integer [pk]
+    userid integer [ref: > userd.id]
+}
+
+Table tagd {
+    id integer [pk, ref: <> postd.id]
+}
+
+enum statusd {
+    old
+    new
+}
+"""
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for the docstring of the Model Class
+    """
+    def build(self, **options):
+        registry = Registry()
+        registry.createModels(PyDBML(SOURCE), **options)
+        self.addCleanup(registry.dispose)
+        return registry
+
+    def test_doc(self):
+        registry = self.build()
+        self.assertIsInstance(vars(registry.Userd)['__doc__'], ClassDoc)
+        self.assertEqual(registry.Userd.__doc__, "users of the application\n\n:param id:  (primary key, autoincrement)\n:type id: integer\n:param name: name of the user (not null)\n:type name: varchar(100)\n:param status:  (default: new)\n:type status: statusd\n:param postds:\n:type postds: relationship(Postd):")
+        self.assertEqual(registry.Userd(id=1).__doc__, registry.Userd.__doc__)
+        # pieces are joined once
+        self.assertEqual(len(vars(registry.Userd)['__doc__'].pieces), 1)
+
+    def test_lazy(self):
+        registry = self.build(doc='lazy')
+        self.assertIs(vars(registry.Userd)['__doc__'], lazyDoc)
+        self.assertEqual(registry.Userd.__doc__, self.build().Userd.__doc__.rstrip(':'))
+        self.assertIn(":param postds:\n:type postds: relationship(Postd)", registry.Tagd.__doc__)
+        self.assertTrue(registry.Tagdpostd.__doc__.startswith("Tagdpostd Table\n\n"))
+
+    def test_no_doc(self):
+        registry = self.build(doc=False)
+        self.assertIsNone(registry.Userd.__doc__)
+        self.assertIsNone(registry.Tagdpostd.__doc__)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import types
+import unittest
+from unittest import mock
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import Registry, Naming, SnakeNaming, createTables, createModels
+from dbml_to_sqlalchemy import main
+from dbml_to_sqlalchemy.registry import createBase
+
+
+SOURCE = """
+Table user_account {
+    id integer [pk]
+    "Full Name" varchar
+}
+
+Table blog_post {
+    id integer [pk]
+    user_id integer [ref: > user_account.id]
+}
+
+Table tag {
+    id integer [pk, ref: <> blog_post.id]
+}
+"""
+
+
+class CountNaming(Naming):
+
+    def __init__(self):
+        Naming.__init__(self)
+        self.calls = 0
+
+    def toClassName(self, name):
+        self.calls = self.calls + 1
+        return Naming.toClassName(self, name)
+
+
+class TrackNaming(Naming):
+    instances = []
+
+    def __init__(self):
+        Naming.__init__(self)
+        TrackNaming.instances.append(self)
+
+
+class PrefixNaming(Naming):
+
+    def toTableName(self, name):
+        return 'app_%s' % Naming.toTableName(self, name)
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for the naming of classes, tables and columns
+    """
+    def test_mapping(self):
+        with Registry() as registry:
+            registry.createModels(PyDBML(SOURCE))
+            mapping = registry.naming.mapping()
+            self.assertEqual(mapping['classes'], {'user_account': 'Useraccount', 'blog_post': 'Blogpost', 'tag': 'Tag', 'tag_blog_post': 'Tagblogpost'})
+            self.assertEqual(mapping['tables']['user_account'], 'user_account')
+            self.assertEqual(mapping['columns']['Full Name'], 'full_name')
+            self.assertEqual(registry.Useraccount.__table__.c.full_name.name, 'full_name')
+
+    def test_cache(self):
+        naming = CountNaming()
+        with Registry(naming=naming) as registry:
+            registry.createModels(PyDBML(SOURCE))
+            self.assertEqual(naming.calls, len(naming.classes))
+
+    def test_snake(self):
+        with Registry(naming=SnakeNaming()) as registry:
+            registry.createModels(PyDBML(SOURCE))
+            self.assertEqual(registry.user_account.__name__, 'user_account')
+            self.assertIn('tag_blog_post', vars(registry.models))
+            engine = db.create_engine("sqlite://", echo=False)
+            registry.metadata.create_all(engine)
+            with Session(engine) as session:
+                user = registry.user_account(id=1)
+                session.add(user)
+                session.add(registry.blog_post(id=1, user_id=1))
+                session.commit()
+                self.assertEqual(len(user.blog_posts), 1)
+
+    def test_table_name(self):
+        with Registry(naming=PrefixNaming()) as registry:
+            registry.createModels(PyDBML(SOURCE))
+            self.assertEqual(sorted(registry.metadata.tables), ['app_blog_post', 'app_tag', 'app_tag_blog_post', 'app_user_account'])
+        metadata = db.MetaData()
+        createTables(PyDBML(SOURCE), metadata, naming=PrefixNaming())
+        self.assertEqual([fk.target_fullname for fk in metadata.tables['app_blog_post'].foreign_keys], ['app_user_account.id'])
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+    def test_build(self):
+        # without naming, the names are cached by build and not by the process
+        TrackNaming.instances = []
+        with mock.patch.object(main, 'Naming', TrackNaming):
+            for i in range(2):
+                Base = createBase()
+                createModels(PyDBML(SOURCE), Base, module=types.ModuleType('models'))
+                Base.registry.dispose()
+        self.assertEqual(len(TrackNaming.instances), 2)
+        self.assertEqual(TrackNaming.instances[0].mapping(), TrackNaming.instances[1].mapping())
+        self.assertFalse(hasattr(main, 'defaultNaming'))
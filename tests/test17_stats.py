@@ -0,0 +1,95 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import Registry
+from dbml_to_sqlalchemy.loader import loadDbml
+from dbml_to_sqlalchemy.stats import BuildStats
+
+
+SOURCE = """
+Table users {
+    id integer [pk]
+    name varchar
+}
+
+Table posts {
+    id integer [pk]
+    userid integer [ref: > users.id]
+}
+
+Table tags {
+    id integer [pk, ref: <> posts.id]
+}
+
+Table other {
+    id integer [pk]
+}
+"""
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for dbml_to_sqlalchemy.stats
+    """
+    def test_models(self):
+        stats = BuildStats()
+        with Registry() as registry:
+            registry.createModels(PyDBML(SOURCE), stats=stats)
+            self.assertEqual(stats.counters['mappers_configured'], 0)
+            registry.Base.registry.configure()
+            self.assertEqual(stats.counters['mappers_configured'], 5)
+        self.assertEqual(stats.counters['tables'], 4)
+        self.assertEqual(stats.counters['associations'], 1)
+        self.assertEqual(stats.counters['refs_matched'], 2)
+        self.assertEqual(sorted(stats.phases), ['associations', 'columns', 'mapping', 'relationships'])
+        self.assertEqual(sorted(stats.tables), ['other', 'posts', 'tags', 'users'])
+        self.assertEqual(sorted(stats.tables['tags']), ['associations', 'columns', 'mapping', 'relationships'])
+        self.assertGreaterEqual(stats.phases['relationships'], stats.phases['associations'])
+        self.assertEqual(json.loads(stats.toJson()), stats.toDict())
+
+    def test_other_build(self):
+        # the mappers of a later build on the same base are not counted
+        stats = BuildStats()
+        with Registry() as registry:
+            registry.createModels(PyDBML(SOURCE), stats=stats)
+            registry.createModels(PyDBML("Table more {\n    id integer [pk]\n}"))
+            registry.Base.registry.configure()
+            self.assertEqual(stats.counters['mappers_configured'], 5)
+            self.assertEqual(len(registry.Base.registry.mappers), 6)
+
+    def test_model(self):
+        stats = BuildStats()
+        parsed = PyDBML(SOURCE)
+        with Registry() as registry:
+            for table in parsed.tables:
+                registry.createModel(table, stats=stats)
+        self.assertEqual(stats.counters['refs_scanned'], 8)
+        self.assertEqual(stats.counters['refs_matched'], 2)
+        self.assertIn('scan', stats.tables['other'])
+
+    def test_lazy(self):
+        stats = BuildStats()
+        with Registry() as registry:
+            registry.createLazyModels(PyDBML(SOURCE), stats=stats)
+            registry.Posts
+            self.assertEqual(stats.counters['tables'], 3)
+            self.assertEqual(stats.counters['refs_matched'], 2)
+
+    def test_parse(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        path = os.path.join(tmp, 'schema.dbml')
+        with open(path, 'w') as f:
+            f.write(SOURCE)
+        stats = BuildStats()
+        loadDbml(path, stats=stats)
+        loadDbml(path, stats=stats)
+        self.assertEqual(sorted(stats.phases), ['cache', 'parse'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import sqlalchemy as db
+from sqlalchemy.orm import Session
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import Registry
+
+
+SOURCE = """
+Table users {
+    id integer [pk]
+    "Full Name" varchar
+}
+
+Table posts {
+    id integer [pk]
+    userid integer [ref: > users.id]
+}
+
+Table tags {
+    id integer [pk, ref: <> posts.id]
+}
+"""
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for dbml_to_sqlalchemy.serializer
+    """
+    def setUp(self):
+        self.registry = Registry()
+        self.registry.createModels(PyDBML(SOURCE))
+        self.engine = db.create_engine("sqlite://", echo=False)
+        self.registry.metadata.create_all(self.engine)
+        with Session(self.engine) as session:
+            session.add(self.registry.Users.from_dict({'id': 1, 'Full Name': 'bob', 'other': 'ignored'}))
+            session.add_all([self.registry.Posts(id=1, userid=1), self.registry.Posts(id=2, userid=1)])
+            session.commit()
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.registry.dispose()
+
+    def test_to_dict(self):
+        with Session(self.engine) as session:
+            user = session.get(self.registry.Users, 1)
+            self.assertEqual(user.to_dict(), {'id': 1, 'Full Name': 'bob'})
+            self.assertEqual(user.to_dict(depth=1), {'id': 1, 'Full Name': 'bob', 'postss': [{'id': 1, 'userid': 1}, {'id': 2, 'userid': 1}]})
+            post = session.get(self.registry.Posts, 1)
+            self.assertEqual(post.to_dict(depth=2)['users'], {'id': 1, 'Full Name': 'bob', 'postss': [{'id': 1, 'userid': 1}, {'id': 2, 'userid': 1}]})
+            self.assertEqual(post.to_dict(depth=1)['tagspostss'], [])
+            self.assertEqual(self.registry.Tagsposts(tags_id=1, posts_id=2).to_dict(), {'tags_id': 1, 'posts_id': 2})
+
+    def test_to_dicts(self):
+        expected = [{'id': 1, 'userid': 1}, {'id': 2, 'userid': 1}]
+        Posts = self.registry.Posts
+        with Session(self.engine) as session:
+            self.assertEqual(Posts.to_dicts(session.scalars(db.select(Posts).order_by(Posts.id)).all()), expected)
+            self.assertEqual(Posts.to_dicts(session.execute(db.select(Posts).order_by(Posts.id)).all()), expected)
+        with self.engine.connect() as connection:
+            self.assertEqual(Posts.to_dicts(connection.execute(db.select(Posts.__table__).order_by(Posts.id)).all()), expected)
+            users = connection.execute(db.select(self.registry.Users.__table__)).all()
+            self.assertEqual(self.registry.Users.to_dicts(users), [{'id': 1, 'Full Name': 'bob'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from types import ModuleType
+import sqlalchemy as db
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import Registry
+from dbml_to_sqlalchemy.rows import createRow, createRows, selectRows, fetchRows, iterRows
+
+
+SOURCE = """
+Table users {
+    id integer [pk]
+    "Full Name" varchar
+    Note: 'Stores user data'
+}
+
+Table posts {
+    id integer [pk]
+    userid integer [ref: > users.id]
+}
+"""
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for dbml_to_sqlalchemy.rows
+    """
+    def setUp(self):
+        self.parsed = PyDBML(SOURCE)
+        self.registry = Registry()
+        self.registry.createModels(self.parsed)
+        self.engine = db.create_engine("sqlite://", echo=False)
+        self.registry.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            connection.execute(db.insert(self.registry.Users.__table__), [{'id': 1, 'full_name': 'bob'}, {'id': 2, 'full_name': 'alice'}])
+            connection.execute(db.insert(self.registry.Posts.__table__), [{'id': 1, 'userid': 1}, {'id': 2, 'userid': 1}])
+        self.module = ModuleType('rows')
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.registry.dispose()
+
+    def test_create(self):
+        UsersRow, PostsRow = createRows(self.parsed, module=self.module)
+        self.assertIs(self.module.UsersRow, UsersRow)
+        self.assertEqual(UsersRow._fields, ('id', 'full_name'))
+        self.assertEqual(UsersRow.__tablename__, 'users')
+        self.assertEqual(UsersRow.__doc__, 'Stores user data (read only)')
+        row = UsersRow(1, 'bob')
+        self.assertFalse(hasattr(row, '__dict__'))
+        self.assertEqual(row.full_name, 'bob')
+        self.assertEqual(row._asdict(), {'id': 1, 'full_name': 'bob'})
+        with self.assertRaises(AttributeError):
+            row.id = 2
+        # a name which is not an identifier
+        table = PyDBML('Table t {\n"class" integer [pk]\n"1st" varchar\n}').tables[0]
+        self.assertEqual(createRow(table, module=self.module)._fields, ('_0', '_1'))
+
+    def test_fetch(self):
+        UsersRow = createRow(self.parsed.tables[0], module=self.module)
+        Users = self.registry.Users
+        expected = [UsersRow(1, 'bob'), UsersRow(2, 'alice')]
+        self.assertEqual(fetchRows(self.engine, UsersRow, Users), expected)
+        self.assertEqual(fetchRows(self.engine, UsersRow, Users.__table__), expected)
+        with self.engine.connect() as connection:
+            rows = fetchRows(connection, UsersRow, selectRows(UsersRow, Users).where(Users.id > 1))
+            self.assertEqual(rows, [UsersRow(2, 'alice')])
+            self.assertIsInstance(rows[0], UsersRow)
+            self.assertEqual(list(iterRows(connection, UsersRow, Users, batch=1)), expected)
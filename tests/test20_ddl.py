@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+import sqlalchemy as db
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import createTables
+from dbml_to_sqlalchemy.ddl import createScript, renderScript, applyScript
+
+
+SOURCE = """
+Enum status {
+    active
+    closed
+}
+
+Table users {
+    id integer [pk, note: 'key of user']
+    team_id integer [ref: > teams.id]
+    status status
+    name varchar [default: '100%']
+}
+
+Table teams {
+    id integer [pk]
+    owner_id integer [ref: > users.id]
+    name varchar
+    Indexes {
+        name
+    }
+}
+
+Table posts {
+    id integer [pk]
+    user_id integer [ref: > users.id]
+}
+"""
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for dbml_to_sqlalchemy.ddl
+    """
+    def setUp(self):
+        self.metadata = db.MetaData()
+        createTables(PyDBML(SOURCE), self.metadata)
+
+    def test_postgresql(self):
+        script = createScript(self.metadata, 'postgresql')
+        kinds = [stmt.split('(')[0].split()[:2] for stmt in script]
+        self.assertEqual(kinds[0], ['CREATE', 'TYPE'])
+        self.assertIn("CREATE TYPE status AS ENUM ('active', 'closed')", script)
+        self.assertIn("COMMENT ON COLUMN users.id IS 'key of user'", script)
+        self.assertIn("CREATE INDEX ix_teams_name ON teams (name)", script)
+        # the cycle users <-> teams is closed by ALTER at the end, posts is after users
+        self.assertEqual(kinds[-2:], [['ALTER', 'TABLE'], ['ALTER', 'TABLE']])
+        tables = [stmt.split()[2] for stmt in script if stmt.startswith('CREATE TABLE')]
+        self.assertLess(tables.index('users'), tables.index('posts'))
+        self.assertNotIn('REFERENCES', ''.join(stmt for stmt in script if stmt.startswith('CREATE TABLE users') or stmt.startswith('CREATE TABLE teams')))
+        self.assertIn("'100%'", renderScript(self.metadata, 'postgresql'))
+        self.assertTrue(renderScript(self.metadata, 'postgresql').endswith(';\n\n'))
+        # use_alter is not kept on the constraints of the metadata
+        self.assertEqual([constraint.use_alter for table in self.metadata.tables.values() for constraint in table.foreign_key_constraints], [False, False, False])
+
+    def test_sqlite(self):
+        script = createScript(self.metadata, 'sqlite')
+        # no ALTER for sqlite, the foreign keys stay in CREATE TABLE
+        self.assertEqual([stmt for stmt in script if stmt.startswith('ALTER')], [])
+        self.assertIn('REFERENCES teams (id)', [stmt for stmt in script if stmt.startswith('CREATE TABLE users')][0])
+        self.assertNotIn('CREATE TYPE', ''.join(script))
+
+    def test_apply(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = db.create_engine("sqlite:///%s" % os.path.join(tmp, 'test.db'))
+            self.assertEqual(applyScript(engine, self.metadata), len(createScript(self.metadata, 'sqlite')))
+            self.assertEqual(sorted(db.inspect(engine).get_table_names()), ['posts', 'teams', 'users'])
+            with engine.begin() as connection:
+                connection.execute(db.insert(self.metadata.tables['users']).values(id=1))
+            # posts exists: the transaction is rolled back, no table is added
+            other = db.MetaData()
+            db.Table('other', other, db.Column('id', db.Integer, primary_key=True))
+            db.Table('posts', other, db.Column('id', db.Integer, primary_key=True))
+            with self.assertRaises(Exception):
+                applyScript(engine, other)
+            self.assertEqual(sorted(db.inspect(engine).get_table_names()), ['posts', 'teams', 'users'])
+            with engine.connect() as connection:
+                self.assertEqual(connection.execute(db.select(self.metadata.tables['users'].c.name)).scalar(), '100%')
+            engine.dispose()
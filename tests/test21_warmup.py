@@ -0,0 +1,103 @@
+import gc
+import os
+import tempfile
+import unittest
+from unittest import mock
+import sqlalchemy as db
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from pydbml import PyDBML
+
+from dbml_to_sqlalchemy import Registry
+
+
+SOURCE = """
+Table userw {
+    id integer [pk]
+    name varchar
+}
+
+Table postw {
+    id integer [pk]
+    userid integer [ref: > userw.id]
+}
+
+Table tagw {
+    id integer [pk, ref: <> postw.id]
+}
+"""
+
+
+class BasicTest(unittest.TestCase):
+    """
+        Class for Basic Unitaire Test for dbml_to_sqlalchemy.warmup
+    """
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engine = db.create_engine("sqlite:///%s" % os.path.join(self.tmp.name, 'test.db'), echo=False)
+        self.registry = Registry()
+        self.registry.createLazyModels(PyDBML(SOURCE))
+        self.hits = []
+        event.listen(self.engine, 'before_cursor_execute', lambda conn, cursor, stmt, params, context, many: self.hits.append(context.cache_hit.name))
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.registry.dispose()
+        self.tmp.cleanup()
+
+    def test_warmup(self):
+        self.assertNotIn('Userw', vars(self.registry.models))
+        stats = self.registry.warmup(self.engine)
+        self.assertEqual(stats['lazy'], 3)
+        self.assertEqual(stats['mappers'], 4)
+        self.assertEqual(stats['relationships'], 8)
+        self.assertEqual(stats['statements'], 12)
+        self.assertIn('Tagwpostw', vars(self.registry.models))
+        self.assertTrue(all(mapper.configured for mapper in self.registry.Base.registry.mappers))
+        # no connection is kept by the pool
+        self.assertEqual(self.engine.pool.checkedin(), 0)
+        self.registry.metadata.create_all(self.engine)
+        Userw = self.registry.Userw
+        self.hits.clear()
+        with Session(self.engine) as session:
+            self.assertIsNone(session.execute(Userw.__dbml_get__, {'id': 1}).scalar_one_or_none())
+        with self.engine.begin() as connection:
+            connection.execute(Userw.__dbml_insert__, {'id': 1, 'name': 'bob'})
+            connection.execute(db.insert(Userw.__table__), [{'id': 2, 'name': 'alice'}, {'id': 3, 'name': 'eve'}])
+        self.assertEqual(self.hits, ['CACHE_HIT', 'CACHE_HIT', 'CACHE_HIT'])
+        # a second warmup keeps the statements
+        get = Userw.__dbml_get__
+        self.registry.warmup()
+        self.assertIs(Userw.__dbml_get__, get)
+
+    def test_private_api(self):
+        # a change of the private api of the cache is not fatal
+        with mock.patch('sqlalchemy.sql.elements.ClauseElement._compile_w_cache', side_effect=TypeError('signature')):
+            stats = self.registry.warmup(self.engine)
+        self.assertEqual(stats['statements'], 12)
+        self.registry.metadata.create_all(self.engine)
+        with Session(self.engine) as session:
+            self.assertIsNone(session.execute(self.registry.Userw.__dbml_get__, {'id': 1}).scalar_one_or_none())
+
+    @unittest.skipIf(not hasattr(os, 'fork'), "needs os.fork")
+    def test_fork(self):
+        # the lazy classes are built without engine, the tables are created before the warmup of the engine
+        self.registry.warmup()
+        self.registry.metadata.create_all(self.engine)
+        self.registry.warmup(self.engine, freeze=True)
+        self.hits.clear()
+        try:
+            self.assertGreater(gc.get_freeze_count(), 0)
+            pid = os.fork()
+            if pid == 0:
+                # worker: the mappers and the cache of the master are inherited
+                code = 1
+                try:
+                    with Session(self.engine) as session:
+                        session.execute(self.registry.Postw.__dbml_get__, {'id': 1}).all()
+                    code = 0 if self.hits == ['CACHE_HIT'] else 2
+                finally:
+                    os._exit(code)
+            self.assertEqual(os.waitpid(pid, 0)[1], 0)
+        finally:
+            gc.unfreeze()